@@ -104,30 +104,41 @@ class AITrendResearcher:
     
     async def _conduct_research(self, keywords: List[str]) -> List[Dict[str, Any]]:
         """Conduct research across all platforms and keywords"""
-        all_research_data = []
-        
-        for keyword in keywords:
-            for platform in self.platforms:
-                try:
-                    research_result = await self._research_platform_keyword(platform, keyword)
-                    all_research_data.append(research_result)
-                    print(f"✓ Completed research: {keyword} on {platform}")
-                except Exception as e:
-                    print(f"✗ Error researching {keyword} on {platform}: {e}")
-                    # Add error result to maintain data consistency
-                    error_result = {
-                        "platform": platform,
-                        "keyword": keyword,
-                        "timestamp": datetime.now().isoformat(),
-                        "results": [],
-                        "new_keywords": [],
-                        "sentiment_score": 0.0,
-                        "engagement_metrics": {},
-                        "error": str(e)
-                    }
-                    all_research_data.append(error_result)
-        
-        return all_research_data
+        # Seed the arXiv translation cache with one batched Claude call
+        # instead of a round trip per keyword during research
+        if "arxiv" in self.platforms and self.claude_client:
+            arxiv_handler = PlatformHandlerFactory.create_handler("arxiv", self.claude_client)
+            arxiv_handler.translate_keywords_batch(keywords)
+
+        # Fan out all platform/keyword tool calls concurrently; MCP sessions
+        # multiplex requests, so a batch costs roughly the slowest call
+        # instead of the sum of all round trips
+        tasks = [
+            self._research_safely(platform, keyword)
+            for keyword in keywords
+            for platform in self.platforms
+        ]
+        return list(await asyncio.gather(*tasks))
+
+    async def _research_safely(self, platform: str, keyword: str) -> Dict[str, Any]:
+        """Research one platform/keyword pair, converting failures to error results"""
+        try:
+            research_result = await self._research_platform_keyword(platform, keyword)
+            print(f"✓ Completed research: {keyword} on {platform}")
+            return research_result
+        except Exception as e:
+            print(f"✗ Error researching {keyword} on {platform}: {e}")
+            # Return error result to maintain data consistency
+            return {
+                "platform": platform,
+                "keyword": keyword,
+                "timestamp": datetime.now().isoformat(),
+                "results": [],
+                "new_keywords": [],
+                "sentiment_score": 0.0,
+                "engagement_metrics": {},
+                "error": str(e)
+            }
     
     async def _research_platform_keyword(self, platform: str, keyword: str) -> Dict[str, Any]:
         """Research a specific platform for a keyword using appropriate handler"""
@@ -135,6 +146,7 @@ class AITrendResearcher:
         if self.mcp_manager.is_platform_available(platform):
             try:
                 handler = PlatformHandlerFactory.create_handler(platform, self.claude_client)
+                handler.begin_batch()
                 client = self.mcp_manager.get_client(platform)
                 config = ServerConfig.get_server_configs()[platform]
                 
@@ -36,14 +36,21 @@ class KeywordExtractor:
         """Prepare content summary for Claude analysis"""
         content_summary = []
         for data in research_data:
-            if data.get('results'):
-                for result in data['results'][:3]:  # Limit to first 3 results per platform
-                    content_summary.append({
-                        'platform': data['platform'],
-                        'keyword': data['keyword'],
-                        'title': result.get('title', ''),
-                        'description': result.get('description', result.get('snippet', ''))[:200]
-                    })
+            results = data.get('results')
+            if not results:
+                continue
+            platform = data['platform']
+            keyword = data['keyword']
+            for result in results[:3]:  # Limit to first 3 results per platform
+                description = result.get('description') or result.get('snippet') or ''
+                if len(description) > 200:
+                    description = description[:200]
+                content_summary.append({
+                    'platform': platform,
+                    'keyword': keyword,
+                    'title': result.get('title', ''),
+                    'description': description
+                })
         return content_summary
     
     def _create_extraction_prompt(self, content_summary: List[Dict]) -> str:
@@ -90,12 +97,20 @@ class DataAnalyzer:
     @staticmethod
     def score_keywords(keywords: List[str], research_data: List[Dict]) -> Dict[str, int]:
         """Score new keywords based on research data"""
+        if not keywords:
+            return {}
+
+        # Stringify and lowercase each data item once instead of once per
+        # keyword; the repeated str(data).lower() dominated the old O(K*S) scan
+        haystacks = [str(data).lower() for data in research_data]
+
         scores = {}
+        base_score = 50
         for keyword in keywords:
-            base_score = 50
-            mention_count = sum(1 for data in research_data if keyword.lower() in str(data).lower())
+            needle = keyword.lower()
+            mention_count = sum(1 for haystack in haystacks if needle in haystack)
             scores[keyword] = min(100, base_score + mention_count * 5)
-        
+
         return scores
     
     @staticmethod
@@ -1,8 +1,38 @@
-import json
 import os
 from datetime import datetime
 from typing import Dict, List, Optional
 
+import orjson
+
+# Formatted timestamps are cached per second so batch operations don't pay
+# strftime's locale machinery on every call.
+_cached_second = -1
+_cached_date = ""
+_cached_time = ""
+
+
+def _refresh_time_cache():
+    global _cached_second, _cached_date, _cached_time
+    now = datetime.now()
+    second = int(now.timestamp())
+    if second != _cached_second:
+        _cached_date = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+        _cached_time = f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+        _cached_second = second
+
+
+def _today() -> str:
+    """Current date as YYYY-MM-DD (cached per second)"""
+    _refresh_time_cache()
+    return _cached_date
+
+
+def _current_time() -> str:
+    """Current time as HH:MM:SS (cached per second)"""
+    _refresh_time_cache()
+    return _cached_time
+
+
 class KeywordManager:
     def __init__(self, keywords_dir: str = "keywords"):
         self.keywords_dir = keywords_dir
@@ -13,66 +43,71 @@ class KeywordManager:
     def load_master_keywords(self) -> Dict:
         """Load master keywords from JSON file"""
         try:
-            with open(self.master_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.master_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if data else {}
         except FileNotFoundError:
             return {}
     
     def load_active_keywords(self) -> List[str]:
         """Load active keywords from JSON file"""
         try:
-            with open(self.active_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.active_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if data else []
         except FileNotFoundError:
             return []
     
     def load_history(self) -> Dict:
         """Load execution history from JSON file"""
         try:
-            with open(self.history_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(self.history_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if data else {}
         except FileNotFoundError:
             return {}
     
     def save_master_keywords(self, keywords: Dict):
         """Save master keywords to JSON file"""
-        with open(self.master_file, 'w', encoding='utf-8') as f:
-            json.dump(keywords, f, ensure_ascii=False, indent=2)
+        with open(self.master_file, 'wb') as f:
+            f.write(orjson.dumps(keywords, option=orjson.OPT_INDENT_2))
     
     def save_active_keywords(self, keywords: List[str]):
         """Save active keywords to JSON file"""
-        with open(self.active_file, 'w', encoding='utf-8') as f:
-            json.dump(keywords, f, ensure_ascii=False, indent=2)
+        with open(self.active_file, 'wb') as f:
+            f.write(orjson.dumps(keywords, option=orjson.OPT_INDENT_2))
     
     def save_history(self, history: Dict):
         """Save execution history to JSON file"""
-        with open(self.history_file, 'w', encoding='utf-8') as f:
-            json.dump(history, f, ensure_ascii=False, indent=2)
+        with open(self.history_file, 'wb') as f:
+            f.write(orjson.dumps(history, option=orjson.OPT_INDENT_2))
     
     def add_new_keyword(self, keyword: str, score: int = 50, source: str = "discovered", discovered_from: Optional[str] = None):
         """Add new keyword to master list"""
         master = self.load_master_keywords()
-        
-        if keyword not in master:
-            master[keyword] = {
-                "score": score,
-                "last_used": None,
-                "source": source,
-                "created_date": datetime.now().strftime("%Y-%m-%d")
-            }
-            
-            if discovered_from:
-                master[keyword]["discovered_from"] = discovered_from
-            
-            self.save_master_keywords(master)
-            return True
-        return False
+
+        if keyword in master:
+            return False
+
+        entry = {
+            "score": score,
+            "last_used": None,
+            "source": source,
+            "created_date": _today()
+        }
+        if discovered_from:
+            entry["discovered_from"] = discovered_from
+        master[keyword] = entry
+
+        self.save_master_keywords(master)
+        return True
     
     def update_keyword_score(self, keyword: str, new_score: int):
         """Update keyword score"""
         master = self.load_master_keywords()
-        if keyword in master:
-            master[keyword]["score"] = new_score
+        entry = master.get(keyword)
+        if entry is not None:
+            entry["score"] = new_score
             self.save_master_keywords(master)
             return True
         return False
@@ -80,22 +115,23 @@ class KeywordManager:
     def mark_keywords_used(self, keywords: List[str]):
         """Mark keywords as used today"""
         master = self.load_master_keywords()
-        today = datetime.now().strftime("%Y-%m-%d")
-        
+        today = _today()
+
         for keyword in keywords:
-            if keyword in master:
-                master[keyword]["last_used"] = today
+            entry = master.get(keyword)
+            if entry is not None:
+                entry["last_used"] = today
         
         self.save_master_keywords(master)
     
     def record_execution(self, keywords: List[str], status: str = "completed", new_keywords_found: int = 0):
         """Record execution in history"""
         history = self.load_history()
-        today = datetime.now().strftime("%Y-%m-%d")
-        
+        today = _today()
+
         history[today] = {
             "keywords": keywords,
-            "execution_time": datetime.now().strftime("%H:%M:%S"),
+            "execution_time": _current_time(),
             "status": status,
             "new_keywords_found": new_keywords_found
         }
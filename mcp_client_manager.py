@@ -1,118 +1,132 @@
 import asyncio
-import os
+import logging
 from typing import Dict, List, Any, Optional
 from contextlib import AsyncExitStack
 from mcp import ClientSession
 from mcp.client.stdio import stdio_client, StdioServerParameters
 
+log = logging.getLogger(__name__)
+
 
 class RemoteMCPClient:
     """MCP Client for connecting to local servers by name"""
     
     def __init__(self):
         self.session: Optional[ClientSession] = None
-        self.exit_stack: Optional[AsyncExitStack] = None
+        self.exit_stack: Optional[AsyncExitStack] = None  # standalone connects only
         self._connected = False
-        self._cleanup_attempted = False
-        self._available_tools: List[str] = []
-        
-    async def connect_to_server_by_name(self, server_name: str, args: List[str] = None, env: Dict[str, str] = None):
-        """Connect to a local MCP server by name using stdio transport"""
+        self._ready = False  # single flag checked on the call_tool fast path
+        self._available_tools: tuple = ()
+        self._response_attr: Optional[str] = None
+
+    async def connect_to_server_by_name(self, server_name: str, args: List[str] = None, env: Dict[str, str] = None,
+                                        exit_stack: Optional[AsyncExitStack] = None):
+        """Connect to a local MCP server by name using stdio transport
+
+        When exit_stack is given (the manager's shared stack), the entered
+        contexts are transferred to it on success so one aclose() at shutdown
+        unwinds every client together instead of serial per-client timeouts.
+        """
+        stack = AsyncExitStack()
         try:
-            self.exit_stack = AsyncExitStack()
-            
             server_params = StdioServerParameters(
                 command=server_name,
                 args=args or [],
                 env=env
             )
-            
-            print(f"🔍 Connecting to {server_name} with args: {args}")
-            if env:
-                print(f"🔍 Environment variables: {list(env.keys())}")
-            
+
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("Connecting to %s with args: %s", server_name, args)
+                if env:
+                    log.debug("Environment variables: %s", list(env.keys()))
+
             stdio_context = stdio_client(server_params)
-            read_stream, write_stream = await self.exit_stack.enter_async_context(stdio_context)
-            
+            read_stream, write_stream = await stack.enter_async_context(stdio_context)
+
             session_context = ClientSession(read_stream, write_stream)
-            self.session = await self.exit_stack.enter_async_context(session_context)
+            self.session = await stack.enter_async_context(session_context)
             await self.session.initialize()
-            
+
             response = await self.session.list_tools()
             tools = response.tools
-            self._available_tools = [tool.name for tool in tools]
-            print(f"✓ Connected to server '{server_name}' with tools: {self._available_tools}")
-            
-            # # Print tool details for debugging
-            # for tool in tools:
-            #     print(f"  - {tool.name}: {tool.description[:100]}...")
-            
-            self._connected = True
-            return True
-            
+            # Immutable post-connect; a tuple needs no defensive copy on return
+            self._available_tools = tuple(tool.name for tool in tools)
+            log.info("Connected to server '%s' with tools: %s", server_name, list(self._available_tools))
+
+            if log.isEnabledFor(logging.DEBUG):
+                for tool in tools:
+                    log.debug("  - %s: %s...", tool.name, tool.description[:100])
+
         except Exception as e:
-            print(f"✗ Failed to connect to server '{server_name}': {e}")
+            log.error("Failed to connect to server '%s': %s", server_name, e)
             self._connected = False
-            await self._cleanup()
+            self._ready = False
+            self.session = None
+            try:
+                await asyncio.wait_for(stack.aclose(), timeout=5.0)
+            except Exception as cleanup_error:
+                log.warning("Error during cleanup: %s", cleanup_error)
             return False
-    
+
+        if exit_stack is not None:
+            await exit_stack.enter_async_context(stack.pop_all())
+        else:
+            self.exit_stack = stack
+
+        self._connected = True
+        self._ready = True
+        return True
+
     async def call_tool(self, tool_name: str, arguments: Dict[str, Any]):
         """Call a tool on the MCP server"""
-        if not self.session or not self._connected:
+        if not self._ready:
             raise Exception("Not connected to any server")
-        
+
+        call = self.session.call_tool
         try:
-            response = await self.session.call_tool(tool_name, arguments)
+            response = await call(tool_name, arguments)
+        except Exception as e:
+            log.error("Error calling tool %s: %s", tool_name, e)
+            return None
+
+        # The response shape is stable for a given server, so resolve which
+        # attribute to unwrap once and skip the hasattr probes on later calls.
+        attr = self._response_attr
+        if attr is None:
             if hasattr(response, 'content'):
-                return response.content
+                attr = 'content'
             elif hasattr(response, 'result'):
-                return response.result
+                attr = 'result'
             else:
-                return response
-        except Exception as e:
-            print(f"✗ Error calling tool {tool_name}: {e}")
-            return None
+                attr = ''
+            self._response_attr = attr
+
+        return getattr(response, attr) if attr else response
     
-    def get_available_tools(self) -> List[str]:
-        """Get list of available tool names"""
+    def get_available_tools(self) -> tuple:
+        """Get available tool names (immutable; safe to share between callers)"""
         return self._available_tools
     
-    async def _cleanup(self):
-        """Internal cleanup method with timeout"""
-        if self._cleanup_attempted:
-            return
-        self._cleanup_attempted = True
-        
-        try:
-            if self.exit_stack:
-                # Add timeout to prevent hanging
-                await asyncio.wait_for(self.exit_stack.aclose(), timeout=5.0)
-        except asyncio.TimeoutError:
-            print("Warning: Cleanup timeout, forcing close")
-            # Force cleanup by setting to None
-            self.exit_stack = None
-        except asyncio.CancelledError:
-            print("Warning: Cleanup was cancelled")
-            # Handle cancellation gracefully
-            self.exit_stack = None
-        except Exception as e:
-            print(f"Warning: Error during cleanup: {e}")
-            self.exit_stack = None
-    
     async def close(self):
-        """Close the connection"""
+        """Close a standalone connection
+
+        Manager-owned clients hold no contexts of their own; their streams
+        are unwound by the manager's shared exit stack.
+        """
         self._connected = False
+        self._ready = False
+        self.session = None
+        stack, self.exit_stack = self.exit_stack, None
+        if stack is None:
+            return
         try:
-            await asyncio.wait_for(self._cleanup(), timeout=10.0)
+            await asyncio.wait_for(stack.aclose(), timeout=10.0)
         except asyncio.TimeoutError:
-            print("Warning: Close timeout, forcing cleanup")
+            log.warning("Close timeout, forcing cleanup")
         except asyncio.CancelledError:
-            print("Warning: Close was cancelled")
+            log.warning("Close was cancelled")
         except Exception as e:
-            print(f"Warning: Error during close: {e}")
-        finally:
-            self.session = None
-            self.exit_stack = None
+            log.warning("Error during close: %s", e)
 
 
 class MCPClientManager:
@@ -121,10 +135,11 @@ class MCPClientManager:
     def __init__(self, server_configs: Dict[str, Dict]):
         self.server_configs = server_configs
         self.clients: Dict[str, RemoteMCPClient] = {}
+        self._stack = AsyncExitStack()
     
     async def connect_all_servers(self):
         """Connect to all available MCP servers"""
-        print("Connecting to MCP servers...")
+        log.info("Connecting to MCP servers...")
         
         for platform, config in self.server_configs.items():
             if config.get("enabled", False):
@@ -138,7 +153,7 @@ class MCPClientManager:
             args = config.get("args", [])
             env = config.get("env", {})
             success = await mcp_client.connect_to_server_by_name(
-                config["server_name"], args, env
+                config["server_name"], args, env, exit_stack=self._stack
             )
             
             if success:
@@ -147,7 +162,7 @@ class MCPClientManager:
                 self.clients[platform] = None
                 
         except Exception as e:
-            print(f"✗ Failed to connect to {platform} MCP server: {e}")
+            log.error("Failed to connect to %s MCP server: %s", platform, e)
             self.clients[platform] = None
     
     def get_client(self, platform: str) -> Optional[RemoteMCPClient]:
@@ -158,19 +173,29 @@ class MCPClientManager:
         """Check if a platform's MCP client is available"""
         return platform in self.clients and self.clients[platform] is not None
     
-    def get_available_tools(self, platform: str) -> List[str]:
+    def get_available_tools(self, platform: str) -> tuple:
         """Get available tools for a specific platform"""
         client = self.get_client(platform)
         if client:
             return client.get_available_tools()
-        return []
+        return ()
     
     async def close_all_clients(self):
-        """Close all MCP clients properly"""
-        for platform, client in self.clients.items():
+        """Close all MCP clients by unwinding the shared exit stack"""
+        for client in self.clients.values():
             if client:
                 try:
-                    await client.close()
+                    await client.close()  # clears flags; contexts live on our stack
                 except Exception:
                     pass
-        self.clients.clear()
\ No newline at end of file
+        self.clients.clear()
+
+        stack, self._stack = self._stack, AsyncExitStack()
+        try:
+            await asyncio.wait_for(stack.aclose(), timeout=10.0)
+        except asyncio.TimeoutError:
+            log.warning("Timeout while unwinding MCP client connections")
+        except asyncio.CancelledError:
+            log.warning("MCP client shutdown was cancelled")
+        except Exception as e:
+            log.warning("Error during MCP client shutdown: %s", e)
\ No newline at end of file
@@ -0,0 +1,26 @@
+"""Lightweight in-process counters for handler hot paths.
+
+Counting how often the expensive branches run (Claude API calls, cache
+hits, text-parse fallbacks) makes it visible where research time actually
+goes; each increment is a single dict add, cheap enough for hot loops.
+"""
+import atexit
+import logging
+from collections import Counter
+
+logger = logging.getLogger(__name__)
+
+COUNTERS = Counter()
+
+
+def inc(name: str, n: int = 1):
+    """Increment a named counter"""
+    COUNTERS[name] += n
+
+
+def _report():
+    if COUNTERS:
+        logger.info("Handler counters: %s", dict(COUNTERS))
+
+
+atexit.register(_report)
@@ -1,7 +1,220 @@
 from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections import Counter
 from typing import Dict, List, Any, Optional
 from datetime import datetime
-import json
+from functools import lru_cache
+from urllib.parse import urlparse
+import asyncio
+import hashlib
+import logging
+import os
+import re
+import sys
+
+import orjson
+
+import metrics
+
+logger = logging.getLogger(__name__)
+
+# Hiragana/katakana plus CJK ideographs; a single C-level scan replaces the
+# per-character set membership loop used previously.
+_JP_RE = re.compile('[\\u3040-\\u30ff\\u4e00-\\u9fff]')
+
+
+def _compile_keywords(*keywords: str) -> 're.Pattern':
+    return re.compile('|'.join(map(re.escape, keywords)))
+
+
+# Content-type buckets compiled once into alternation patterns; checked in
+# priority order so one C-level scan per bucket replaces the old
+# any(keyword in text) substring loops.
+_CONTENT_BUCKETS = (
+    ("解説動画", _compile_keywords('解説', '説明', '入門', '基礎', '学習', 'チュートリアル')),
+    ("デモ", _compile_keywords('デモ', 'デモンストレーション', '実演', '動作確認', 'サンプル')),
+    ("カンファレンス", _compile_keywords('カンファレンス', 'セミナー', '講演', '発表', 'conference', 'talk')),
+    ("ニュース", _compile_keywords('ニュース', '最新', 'アップデート', 'リリース')),
+    ("レビュー", _compile_keywords('レビュー', '比較', '検証', '評価')),
+)
+
+
+# Pure-numeric trend kernels hoisted to module scope; datetime parsing stays
+# with the callers so these see only ints/floats.
+def _trend_metrics_kernel(stars: int, days_old: int) -> tuple:
+    if days_old <= 0:
+        return (0.0, 0, False, False)
+
+    star_rate = stars / days_old
+    is_trending = (stars >= 100 and days_old <= 365)
+    is_accelerating = (star_rate >= 1.0 and stars >= 50)
+
+    return (star_rate, days_old, is_trending, is_accelerating)
+
+
+def _trend_score_kernel(stars: int, days_old: int, star_rate: float) -> float:
+    if days_old <= 0:
+        return 0.0
+
+    base_score = min(star_rate * 10, 50)
+    star_bonus = min(stars / 100, 20)
+    recency_bonus = max(0, (365 - days_old) / 365 * 30)
+
+    acceleration_bonus = 0
+    if star_rate >= 2.0:
+        acceleration_bonus = 20
+    elif star_rate >= 1.0:
+        acceleration_bonus = 10
+
+    total_score = base_score + star_bonus + recency_bonus + acceleration_bonus
+    return round(min(total_score, 100), 2)
+
+
+# Section and field patterns for the numbered text formats returned by the
+# GitHub/HackerNews/arXiv servers, compiled once instead of per parse call.
+_NUMBERED_SECTION_RE = re.compile(r'\n\n\d+\.\s+')
+_CN_SECTION_RE = re.compile(r'\n\n\d+\.\s+\*\*')
+_POINTS_RE = re.compile(r'Points:\s*(\d+)')
+_AUTHOR_RE = re.compile(r'Author:\s*([^|]+)')
+_COMMENTS_RE = re.compile(r'Comments?:\s*(\d+)')
+_CN_PAPER_RE = re.compile(
+    r'\*\*(.*?)\*\*\s*\n\s*ID:\s*([^\n]+)\s*\n\s*发布日期:\s*([^\n]+)\s*\n\s*作者:\s*([^\n]+)'
+    r'\s*\n\s*摘要:\s*([^\n]+)\s*\n\s*URL:\s*([^\n]+)',
+    re.DOTALL,
+)
+
+# Chinese and English "no results" markers folded into one alternation so
+# empty arXiv responses are rejected in a single scan instead of one
+# substring search per marker.
+_NO_RESULTS_RE = re.compile(
+    '找到 ?0 ?篇相关论文|0 篇相关论文|no results found|0 results|no papers found|0 papers',
+    re.IGNORECASE,
+)
+_GH_NO_RESULTS_RE = re.compile(
+    'no repositories found|0 repositories|no results found|0 results|empty result',
+    re.IGNORECASE,
+)
+
+_DAY_SECONDS = 86400.0
+
+
+def _days_old_from_iso(date_str: str, now_ts: float) -> Optional[int]:
+    """Days elapsed since an ISO-8601 date, against a caller-supplied epoch
+
+    Comparing epoch seconds sidesteps per-item tzinfo juggling: aware and
+    naive datetimes both collapse to absolute seconds via timestamp(), so a
+    batch of items shares one datetime.now() call instead of paying for one
+    per row.
+    """
+    try:
+        parsed = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        return int((now_ts - parsed.timestamp()) // _DAY_SECONDS)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+# Trend-score ladders as sorted thresholds + points tables; bisect_left
+# reproduces the old comparison chains (strict > for scores/citations,
+# inclusive <= for ages) with a single lookup instead of 3-4 branches.
+_PAPER_RECENCY_THRESHOLDS = (30, 90, 365)
+_PAPER_RECENCY_POINTS = (30, 20, 10, 0)
+_CITATION_THRESHOLDS = (10, 50, 100)
+_CITATION_POINTS = (0, 5, 15, 25)
+_AI_CATEGORIES = frozenset(('cs.AI', 'cs.LG', 'cs.CL', 'cs.CV', 'cs.NE', 'stat.ML'))
+
+_POST_SCORE_THRESHOLDS = (20, 50, 100)
+_POST_SCORE_POINTS = (0, 10, 20, 30)
+_POST_RECENCY_THRESHOLDS = (1, 3, 7)
+_POST_RECENCY_POINTS = (25, 15, 5, 0)
+_POST_COMMENTS_THRESHOLDS = (5, 20, 50)
+_POST_COMMENTS_POINTS = (0, 5, 10, 20)
+
+_SECTION_BREAK_RE = re.compile('\n\n')
+
+
+def _iter_sections(text: str):
+    """Yield blank-line-separated sections lazily
+
+    Avoids materializing the full split list for large responses; peak
+    memory stays bounded to one section at a time.
+    """
+    start = 0
+    for match in _SECTION_BREAK_RE.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    yield text[start:]
+
+
+def _parse_int_field(value: str) -> int:
+    try:
+        return int(value)
+    except ValueError:
+        return 0
+
+
+def _parse_list_field(value: str) -> List[str]:
+    # Values like categories, topics and author names recur across items in
+    # a batch; interning collapses the duplicates into one shared string and
+    # lets later set/Counter lookups take the identity fast path.
+    value = value.strip()
+    if ', ' in value and ' ,' not in value and ',  ' not in value:
+        # Exactly ", "-delimited (the common case): one C-level split, no
+        # per-item strip loop
+        items = value.split(', ')
+    else:
+        items = [item.strip() for item in value.split(',')]
+    return [sys.intern(item) for item in items if item]
+
+
+# Label -> (field, parser) dispatch for the text response formats; one
+# partition per line replaces a chain of startswith probes and hard-coded
+# slice offsets.
+_GITHUB_FIELD_MAP = {
+    'Name': ('name', str),
+    'Owner': ('owner', str),
+    'Description': ('description', str),
+    'URL': ('url', str),
+    'Stars': ('stars', _parse_int_field),
+    'Language': ('language', str),
+    'Created': ('created_at', str),
+    'Forks': ('forks', _parse_int_field),
+    'Topics': ('topics', _parse_list_field),
+}
+
+_ARXIV_EN_FIELD_MAP = {
+    'Title': ('title', str),
+    'Authors': ('authors', _parse_list_field),
+    'Abstract': ('abstract', str),
+    'Published': ('published_date', str),
+    'arXiv ID': ('arxiv_id', str),
+    'URL': ('url', str),
+    'Categories': ('categories', _parse_list_field),
+}
+
+_ARXIV_CN_FIELD_MAP = {
+    'ID': ('arxiv_id', str),
+    '发布日期': ('published_date', str),
+    '作者': ('authors', _parse_list_field),
+    '摘要': ('abstract', str),
+    'URL': ('url', str),
+}
+
+# Standalone metadata lines in the numbered HackerNews format; the combined
+# "Points: ... | Author: ... | Comments: ..." line is handled by regex first.
+_HN_META_FIELD_MAP = {
+    'Points': ('score', _parse_int_field),
+    'Author': ('author', str),
+    'Comments': ('comments_count', _parse_int_field),
+}
+
+_HN_FIELD_MAP = {
+    'Title': ('title', str),
+    'URL': ('url', str),
+    'Author': ('author', str),
+    'Score': ('score', _parse_int_field),
+    'Comments': ('comments_count', _parse_int_field),
+    'Created': ('created_time', str),
+}
 
 
 class BasePlatformHandler(ABC):
@@ -9,7 +222,15 @@ class BasePlatformHandler(ABC):
     
     def __init__(self, platform_name: str):
         self.platform_name = platform_name
-    
+        self._batch_ts: Optional[str] = None
+
+    def begin_batch(self):
+        """Capture a single timestamp shared by all results in this batch"""
+        self._batch_ts = datetime.now().isoformat()
+
+    def _timestamp(self) -> str:
+        return self._batch_ts or datetime.now().isoformat()
+
     @abstractmethod
     async def research_keyword(self, client, keyword: str, config: Dict) -> Dict[str, Any]:
         """Research a keyword on the platform"""
@@ -20,19 +241,28 @@ class BasePlatformHandler(ABC):
         """Process the platform response into standardized format"""
         pass
     
-    def create_error_result(self, keyword: str, error: str) -> Dict[str, Any]:
-        """Create standardized error result"""
+    def create_result(self, keyword: str, results: List[Dict], engagement_metrics: Dict) -> Dict[str, Any]:
+        """Create standardized result envelope
+
+        Single construction site for the envelope keys; handlers fill in
+        only what differs instead of repeating the literal per platform.
+        """
         return {
             "platform": self.platform_name,
             "keyword": keyword,
-            "timestamp": datetime.now().isoformat(),
-            "results": [],
+            "timestamp": self._timestamp(),
+            "results": results,
             "new_keywords": [],
             "sentiment_score": 0.0,
-            "engagement_metrics": {},
-            "error": error
+            "engagement_metrics": engagement_metrics
         }
 
+    def create_error_result(self, keyword: str, error: str) -> Dict[str, Any]:
+        """Create standardized error result"""
+        result = self.create_result(keyword, [], {})
+        result["error"] = error
+        return result
+
 
 class YouTubeHandler(BasePlatformHandler):
     """YouTube platform research handler"""
@@ -63,87 +293,62 @@ class YouTubeHandler(BasePlatformHandler):
         data = self._extract_data_from_response(response)
         
         videos = data if isinstance(data, list) else data.get('videos', data.get('items', []))
-        
+
         for video in videos:
+            # Pull each field out of the nested dicts once; title and
+            # description feed the result, the classifier and the language
+            # detector, so the repeated get() cascades added up per video.
             snippet = video.get('snippet', {})
             video_id = video.get('id', {}).get('videoId', '')
-            
-            content_type = self._classify_content(
-                snippet.get('title', ''),
-                snippet.get('description', '')
-            )
-            
+            title = snippet.get('title', '')
+            description = snippet.get('description', '')
+
             results.append({
-                'title': snippet.get('title', ''),
-                'description': snippet.get('description', ''),
+                'title': title,
+                'description': description,
                 'published_at': snippet.get('publishedAt', ''),
                 'channel': snippet.get('channelTitle', ''),
                 'video_id': video_id,
                 'url': f"https://www.youtube.com/watch?v={video_id}",
-                'content_type': content_type,
-                'language': self._detect_language(snippet.get('title', '') + ' ' + snippet.get('description', ''))
+                'content_type': self._classify_content(title, description),
+                'language': self._detect_language(title + ' ' + description)
             })
-        
-        return {
-            "platform": self.platform_name,
-            "keyword": keyword,
-            "timestamp": datetime.now().isoformat(),
-            "results": results,
-            "new_keywords": [],
-            "sentiment_score": 0.0,
-            "engagement_metrics": self._calculate_engagement_metrics(results)
-        }
+
+        return self.create_result(keyword, results, self._calculate_engagement_metrics(results))
     
     def _extract_data_from_response(self, response: Any) -> Any:
         """Extract data from various response formats"""
-        if isinstance(response, list) and len(response) > 0:
-            first_item = response[0]
-            if hasattr(first_item, 'text'):
-                try:
-                    return json.loads(first_item.text)
-                except (json.JSONDecodeError, AttributeError):
-                    return {}
-            else:
-                return response
-        elif hasattr(response, 'content') and response.content:
-            return response.content
-        elif isinstance(response, dict):
-            return response
-        else:
-            return {}
+        data = _normalize_mcp_response(response)
+        # The YouTube server always speaks JSON; a raw string means the
+        # payload didn't parse, so there is nothing to extract from it
+        return {} if isinstance(data, str) else data
     
     def _classify_content(self, title: str, description: str) -> str:
         """Classify YouTube content type"""
         text = (title + ' ' + description).lower()
-        
-        if any(keyword in text for keyword in ['解説', '説明', '入門', '基礎', '学習', 'チュートリアル']):
-            return "解説動画"
-        elif any(keyword in text for keyword in ['デモ', 'デモンストレーション', '実演', '動作確認', 'サンプル']):
-            return "デモ"
-        elif any(keyword in text for keyword in ['カンファレンス', 'セミナー', '講演', '発表', 'conference', 'talk']):
-            return "カンファレンス"
-        elif any(keyword in text for keyword in ['ニュース', '最新', 'アップデート', 'リリース']):
-            return "ニュース"
-        elif any(keyword in text for keyword in ['レビュー', '比較', '検証', '評価']):
-            return "レビュー"
-        else:
-            return "その他"
+
+        for content_type, pattern in _CONTENT_BUCKETS:
+            if pattern.search(text):
+                return content_type
+        return "その他"
     
     def _detect_language(self, text: str) -> str:
         """Detect language of the text"""
-        japanese_chars = set('あいうえおかきくけこさしすせそたちつてとなにぬねのはひふへほまみむめもやゆよらりるれろわをんアイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲン')
-        
-        if any(char in japanese_chars for char in text):
-            return "ja"
-        elif any(char.isascii() for char in text):
-            return "en"
-        else:
+        if not text:
             return "unknown"
+        # Cheapest check first: a pure-ASCII title/description (the common
+        # case) is classified in one C-level scan without touching the
+        # regex engine.
+        if text.isascii():
+            return "en"
+        if _JP_RE.search(text):
+            return "ja"
+        return "unknown"
     
     def _calculate_engagement_metrics(self, results: List[Dict]) -> Dict:
         """Calculate YouTube engagement metrics"""
         return {
-            "video_count": len([r for r in results if r.get('content_type') == '解説動画']),
+            "video_count": sum(1 for r in results if r.get('content_type') == '解説動画'),
             "total_videos": len(results)
         }
 
@@ -165,25 +370,35 @@ class GitHubHandler(BasePlatformHandler):
             }
             
             tool_name = config["tools"][1]  # Use "search_repositories" from config
-            print(f"🔍 Calling GitHub tool '{tool_name}' with params: {params}")
+            logger.debug("🔍 Calling GitHub tool '%s' with params: %s", tool_name, params)
             response = await client.call_tool(tool_name, params)
-            print(f"📄 GitHub raw response type: {type(response)}")
+            logger.debug("📄 GitHub raw response type: %s", type(response))
             # print(f"📄 GitHub raw response: {response}")
             
             return self.process_response(response, keyword)
             
         except Exception as e:
-            print(f"❌ Error in GitHub research: {e}")
+            logger.warning("❌ Error in GitHub research: %s", e)
             return self.create_error_result(keyword, str(e))
     
     def process_response(self, response: Any, keyword: str) -> Dict[str, Any]:
         """Process GitHub response"""
-        print(f"🔍 Processing GitHub response for keyword: {keyword}")
+        logger.debug("🔍 Processing GitHub response for keyword: %s", keyword)
         results = []
         repos = self._extract_repositories(response)
         
-        print(f"📄 Processing {len(repos)} repositories")
-        
+        logger.debug("📄 Processing %s repositories", len(repos))
+
+        # One clock read shared by every repo's age math in this batch
+        now_ts = datetime.now().timestamp()
+
+        # Engagement stats accumulate alongside result construction so the
+        # list is traversed once instead of re-scanned afterwards
+        total_stars = 0
+        total_forks = 0
+        trending_count = 0
+        lang_counts = Counter()
+
         for i, repo in enumerate(repos):
             if isinstance(repo, dict):
                 owner_data = repo.get('owner', {})
@@ -192,7 +407,7 @@ class GitHubHandler(BasePlatformHandler):
                 stars = repo.get('stargazers_count', repo.get('stars', 0))
                 created_at = repo.get('created_at', '')
                 
-                star_rate, days_old, is_trending, is_accelerating = self._calculate_trend_metrics(stars, created_at)
+                star_rate, days_old, is_trending, is_accelerating = self._calculate_trend_metrics(stars, created_at, now_ts)
                 
                 result = {
                     'name': repo.get('name', ''),
@@ -216,112 +431,75 @@ class GitHubHandler(BasePlatformHandler):
                 }
                 
                 results.append(result)
-                print(f"📄 Processed repository {i+1}: {result['name']} by {result['owner']} (Stars: {result['stars']}, Language: {result['language']})")
-        
-        engagement_metrics = self._calculate_engagement_metrics(results)
-        print(f"📄 Calculated engagement metrics: {engagement_metrics}")
-        
-        return {
-            "platform": self.platform_name,
-            "keyword": keyword,
-            "timestamp": datetime.now().isoformat(),
-            "results": results,
-            "new_keywords": [],
-            "sentiment_score": 0.0,
-            "engagement_metrics": engagement_metrics
-        }
+
+                total_stars += stars
+                total_forks += result['forks']
+                if is_trending:
+                    trending_count += 1
+                if result['language']:
+                    lang_counts[result['language']] += 1
+
+                logger.debug("📄 Processed repository %s: %s by %s (Stars: %s, Language: %s)", i+1, result['name'], result['owner'], result['stars'], result['language'])
+
+        engagement_metrics = self._finalize_engagement_metrics(
+            len(results), total_stars, total_forks, trending_count, lang_counts
+        )
+        logger.debug("📄 Calculated engagement metrics: %s", engagement_metrics)
+
+        return self.create_result(keyword, results, engagement_metrics)
     
     def _extract_repositories(self, response: Any) -> List[Dict]:
         """Extract repositories from various response formats"""
-        print(f"🔍 Extracting repositories from response type: {type(response)}")
-        repos = []
-        
+        logger.debug("🔍 Extracting repositories from response type: %s", type(response))
+
         # Handle None or empty response
         if not response:
-            print("📄 Response is empty or None")
-            return repos
-        
-        # Handle string response (might be JSON string)
-        if isinstance(response, str):
-            print(f"📄 Response is string: {response[:200]}...")
-            try:
-                parsed_data = json.loads(response)
-                return self._extract_repositories(parsed_data)
-            except json.JSONDecodeError:
-                # Try to parse as text format
-                return self._parse_github_text_response(response)
-        
-        # Handle list response
-        if isinstance(response, list):
-            print(f"📄 Response is list with {len(response)} items")
-            if len(response) > 0:
-                first_item = response[0]
-                print(f"📄 First item type: {type(first_item)}")
-                
-                # Handle TextContent objects
-                if hasattr(first_item, 'text'):
-                    text_content = first_item.text
-                    print(f"📄 First item has text attribute: {text_content[:200]}...")
-                    
-                    # Try JSON parsing
-                    try:
-                        parsed_data = json.loads(text_content)
-                        print(f"📄 Parsed JSON data type: {type(parsed_data)}")
-                        return self._extract_repositories(parsed_data)
-                    except json.JSONDecodeError as e:
-                        print(f"❌ JSON parsing error: {e}")
-                        return self._parse_github_text_response(text_content)
-                else:
-                    # Direct list of repository objects
-                    repos = response
-                    print(f"📄 Treating response as direct list of repositories")
-        
-        # Handle dict response
-        elif isinstance(response, dict):
-            print(f"📄 Response is dict with keys: {list(response.keys())}")
+            logger.debug("📄 Response is empty or None")
+            return []
+
+        data = _normalize_mcp_response(response)
+        if isinstance(data, str):
+            # Not JSON: fall back to the text-format parser
+            metrics.inc("github.parse.text_fallback")
+            return self._parse_github_text_response(data)
+
+        repos = []
+        if isinstance(data, list):
+            # Direct list of repository objects
+            repos = data
+        elif isinstance(data, dict):
             # Try different possible keys for repositories
             for key in ['repositories', 'items', 'data', 'results']:
-                if key in response:
-                    repos = response[key]
-                    print(f"📄 Found repositories under key '{key}': {len(repos)} items")
+                if key in data:
+                    repos = data[key]
+                    logger.debug("📄 Found repositories under key '%s': %s items", key, len(repos))
                     break
-            
+
             # If no repositories found, treat the whole response as a single repository
-            if not repos and any(key in response for key in ['name', 'full_name', 'owner']):
-                repos = [response]
-                print("📄 Treating response as single repository")
-        
-        print(f"📄 Extracted {len(repos)} repositories")
+            if not repos and any(key in data for key in ['name', 'full_name', 'owner']):
+                repos = [data]
+                logger.debug("📄 Treating response as single repository")
+
+        logger.debug("📄 Extracted %s repositories", len(repos))
         return repos
     
     def _parse_github_text_response(self, text: str) -> List[Dict]:
         """Parse GitHub repository results from text format"""
-        print(f"🔍 Parsing GitHub text response: {text[:200]}...")
+        logger.debug("🔍 Parsing GitHub text response: %s...", text[:200])
         results = []
-        
+
         # Check if response indicates no results found
-        no_results_indicators = [
-            "no repositories found",
-            "0 repositories",
-            "no results found",
-            "0 results",
-            "empty result"
-        ]
-        
-        if any(indicator in text.lower() for indicator in no_results_indicators):
-            print(f"📄 No repositories found in response: {text}")
+        if _GH_NO_RESULTS_RE.search(text):
+            logger.debug("📄 No repositories found in response: %s", text)
             return results
         
         # Try to parse numbered format first (similar to HackerNews)
         if text.strip().startswith('1.') or 'Name:' in text:
-            print(f"📄 Detected numbered format, parsing with regex")
+            logger.debug("📄 Detected numbered format, parsing with regex")
             return self._parse_github_numbered_format(text)
         
         # Parse traditional format
-        sections = text.split('\n\n')
-        print(f"📄 Found {len(sections)} sections in text response")
-        
-        for i, section in enumerate(sections):
+        for section in _iter_sections(text):
             if not section.strip():
                 continue
                 
@@ -332,32 +510,12 @@ class GitHubHandler(BasePlatformHandler):
             repo_info = {}
             
             for line in lines:
-                line = line.strip()
-                if line.startswith('Name: '):
-                    repo_info['name'] = line[6:]
-                elif line.startswith('Owner: '):
-                    repo_info['owner'] = line[7:]
-                elif line.startswith('Description: '):
-                    repo_info['description'] = line[13:]
-                elif line.startswith('URL: '):
-                    repo_info['url'] = line[5:]
-                elif line.startswith('Stars: '):
-                    try:
-                        repo_info['stars'] = int(line[7:])
-                    except ValueError:
-                        repo_info['stars'] = 0
-                elif line.startswith('Language: '):
-                    repo_info['language'] = line[10:]
-                elif line.startswith('Created: '):
-                    repo_info['created_at'] = line[9:]
-                elif line.startswith('Forks: '):
-                    try:
-                        repo_info['forks'] = int(line[7:])
-                    except ValueError:
-                        repo_info['forks'] = 0
-                elif line.startswith('Topics: '):
-                    topics_str = line[8:]
-                    repo_info['topics'] = [t.strip() for t in topics_str.split(',') if t.strip()]
+                label, sep, value = line.strip().partition(': ')
+                if not sep:
+                    continue
+                field = _GITHUB_FIELD_MAP.get(label)
+                if field:
+                    repo_info[field[0]] = field[1](value)
             
             if repo_info.get('name') and repo_info.get('owner'):
                 results.append({
@@ -375,20 +533,19 @@ class GitHubHandler(BasePlatformHandler):
                     'size': 0,
                     'open_issues': 0
                 })
-                print(f"📄 Parsed repository: {repo_info.get('name', '')} by {repo_info.get('owner', '')}")
+                logger.debug("📄 Parsed repository: %s by %s", repo_info.get('name', ''), repo_info.get('owner', ''))
         
-        print(f"📄 Successfully parsed {len(results)} repositories from text format")
+        logger.debug("📄 Successfully parsed %s repositories from text format", len(results))
         return results
     
     def _parse_github_numbered_format(self, text: str) -> List[Dict]:
         """Parse the numbered format response from GitHub server"""
         results = []
-        
+
         # Split by numbered entries (1. name, 2. name, etc.)
-        import re
-        sections = re.split(r'\n\n\d+\.\s+', text)
-        
-        print(f"📄 Found {len(sections)} sections in numbered format")
+        sections = _NUMBERED_SECTION_RE.split(text)
+
+        logger.debug("📄 Found %s sections in numbered format", len(sections))
         
         # Skip the first section if it's empty or just whitespace
         for i, section in enumerate(sections[1:], 1):
@@ -421,110 +578,62 @@ class GitHubHandler(BasePlatformHandler):
                 
                 # Parse the metadata lines (indented lines)
                 for line in lines[1:]:
-                    line = line.strip()
-                    
-                    if line.startswith('Owner: '):
-                        repo_info['owner'] = line[7:]
-                    elif line.startswith('Description: '):
-                        repo_info['description'] = line[13:]
-                    elif line.startswith('URL: '):
-                        repo_info['url'] = line[5:]
-                    elif line.startswith('Stars: '):
-                        try:
-                            repo_info['stars'] = int(line[7:])
-                        except ValueError:
-                            repo_info['stars'] = 0
-                    elif line.startswith('Language: '):
-                        repo_info['language'] = line[10:]
-                    elif line.startswith('Created: '):
-                        repo_info['created_at'] = line[9:]
-                    elif line.startswith('Forks: '):
-                        try:
-                            repo_info['forks'] = int(line[7:])
-                        except ValueError:
-                            repo_info['forks'] = 0
-                    elif line.startswith('Topics: '):
-                        topics_str = line[8:]
-                        repo_info['topics'] = [t.strip() for t in topics_str.split(',') if t.strip()]
+                    label, sep, value = line.strip().partition(': ')
+                    if not sep or label == 'Name':
+                        continue
+                    field = _GITHUB_FIELD_MAP.get(label)
+                    if field:
+                        repo_info[field[0]] = field[1](value)
                 
                 # Only add if we have a meaningful name
                 if repo_info['name'] and repo_info['name'] != 'undefined':
                     results.append(repo_info)
-                    print(f"📄 Parsed repository: {repo_info['name']} by {repo_info['owner']} (Stars: {repo_info['stars']})")
+                    logger.debug("📄 Parsed repository: %s by %s (Stars: %s)", repo_info['name'], repo_info['owner'], repo_info['stars'])
                 
             except Exception as e:
-                print(f"❌ Error parsing section {i}: {e}")
+                logger.warning("❌ Error parsing section %s: %s", i, e)
                 continue
         
-        print(f"📄 Successfully parsed {len(results)} repositories from numbered format")
+        logger.debug("📄 Successfully parsed %s repositories from numbered format", len(results))
         return results
     
-    def _calculate_trend_metrics(self, stars: int, created_at: str) -> tuple:
+    def _calculate_trend_metrics(self, stars: int, created_at: str, now_ts: Optional[float] = None) -> tuple:
         """Calculate GitHub repository trend metrics"""
         if not created_at:
             return (0.0, 0, False, False)
-        
-        try:
-            created_date = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-            days_old = (datetime.now(created_date.tzinfo) - created_date).days
-            
-            if days_old <= 0:
-                return (0.0, 0, False, False)
-            
-            star_rate = stars / days_old
-            is_trending = (stars >= 100 and days_old <= 365)
-            is_accelerating = (star_rate >= 1.0 and stars >= 50)
-            
-            return (star_rate, days_old, is_trending, is_accelerating)
-        except Exception:
+
+        if now_ts is None:
+            now_ts = datetime.now().timestamp()
+        days_old = _days_old_from_iso(created_at, now_ts)
+        if days_old is None:
             return (0.0, 0, False, False)
-    
+        return _trend_metrics_kernel(stars, days_old)
+
     def _calculate_trend_score(self, stars: int, days_old: int, star_rate: float) -> float:
         """Calculate comprehensive trend score"""
-        if days_old <= 0:
-            return 0.0
-        
-        base_score = min(star_rate * 10, 50)
-        star_bonus = min(stars / 100, 20)
-        recency_bonus = max(0, (365 - days_old) / 365 * 30)
-        
-        acceleration_bonus = 0
-        if star_rate >= 2.0:
-            acceleration_bonus = 20
-        elif star_rate >= 1.0:
-            acceleration_bonus = 10
-        
-        total_score = base_score + star_bonus + recency_bonus + acceleration_bonus
-        return round(min(total_score, 100), 2)
+        return _trend_score_kernel(stars, days_old, star_rate)
     
-    def _calculate_engagement_metrics(self, results: List[Dict]) -> Dict:
-        """Calculate GitHub engagement metrics"""
-        if not results:
+    def _finalize_engagement_metrics(self, repo_count: int, total_stars: int, total_forks: int,
+                                     trending_count: int, lang_counts: Counter) -> Dict:
+        """Build GitHub engagement metrics from stats gathered during processing"""
+        if not repo_count:
             return {"repo_count": 0}
-        
-        repo_count = len(results)
-        total_stars = sum(repo.get('stars', 0) for repo in results)
-        total_forks = sum(repo.get('forks', 0) for repo in results)
-        
+
         metrics = {
             "repo_count": repo_count,
-            "avg_stars": round(total_stars / repo_count, 2) if repo_count > 0 else 0,
-            "avg_forks": round(total_forks / repo_count, 2) if repo_count > 0 else 0,
+            "avg_stars": round(total_stars / repo_count, 2),
+            "avg_forks": round(total_forks / repo_count, 2),
             "total_stars": total_stars,
             "total_forks": total_forks
         }
-        
+
         # Language distribution
-        languages = [repo.get('language', 'Unknown') for repo in results if repo.get('language')]
-        if languages:
-            from collections import Counter
-            lang_counts = Counter(languages)
+        if lang_counts:
             metrics["top_languages"] = dict(lang_counts.most_common(3))
-        
+
         # Trending analysis
-        trending_repos = [repo for repo in results if repo.get('is_trending', False)]
-        metrics["trending_repos_count"] = len(trending_repos)
-        
+        metrics["trending_repos_count"] = trending_count
+
         return metrics
 
 
@@ -554,31 +663,20 @@ class WebHandler(BasePlatformHandler):
     def process_response(self, response: Any, keyword: str) -> Dict[str, Any]:
         """Process web search response"""
         results = self._parse_web_results(response)
-        
-        return {
-            "platform": self.platform_name,
-            "keyword": keyword,
-            "timestamp": datetime.now().isoformat(),
-            "results": results,
-            "new_keywords": [],
-            "sentiment_score": 0.0,
-            "engagement_metrics": {"search_count": len(results)}
-        }
+        return self.create_result(keyword, results, {"search_count": len(results)})
     
     def _parse_web_results(self, response: Any) -> List[Dict]:
         """Parse web search results from various formats"""
-        results = []
-        
-        # Handle TextContent objects
-        if isinstance(response, list) and len(response) > 0:
-            first_item = response[0]
-            if hasattr(first_item, 'text'):
-                return self._parse_web_search_text(first_item.text)
-        
+        data = _normalize_mcp_response(response)
+        if isinstance(data, str):
+            metrics.inc("web.parse.text_fallback")
+            return self._parse_web_search_text(data)
+
         # Handle structured data
-        if isinstance(response, dict):
-            if 'results' in response or 'items' in response:
-                web_results = response.get('results', response.get('items', []))
+        results = []
+        if isinstance(data, dict):
+            if 'results' in data or 'items' in data:
+                web_results = data.get('results', data.get('items', []))
                 for result in web_results:
                     results.append({
                         'title': result.get('title', ''),
@@ -592,9 +690,7 @@ class WebHandler(BasePlatformHandler):
     def _parse_web_search_text(self, text: str) -> List[Dict]:
         """Parse web search results from text format"""
         results = []
-        sections = text.split('\n\n')
-        
-        for section in sections:
+        for section in _iter_sections(text):
             if not section.strip():
                 continue
                 
@@ -602,19 +698,24 @@ class WebHandler(BasePlatformHandler):
             if len(lines) < 2:
                 continue
             
-            title_line = lines[0]
-            title = title_line[7:] if title_line.startswith('Title: ') else title_line
-            
+            # removeprefix returns the original object when the prefix is
+            # absent, so one call both tests and trims each label
+            title = lines[0].removeprefix('Title: ')
+
             url = ""
-            if len(lines) > 1 and lines[1].startswith('URL: '):
-                url = lines[1][5:]
-            
+            if len(lines) > 1:
+                trimmed = lines[1].removeprefix('URL: ')
+                if trimmed is not lines[1]:
+                    url = trimmed
+
             description = ""
-            if len(lines) > 2 and lines[2].startswith('Description: '):
-                description = lines[2][13:]
-                for line in lines[3:]:
-                    if line.strip() and not line.startswith('URL: '):
-                        description += " " + line.strip()
+            if len(lines) > 2:
+                trimmed = lines[2].removeprefix('Description: ')
+                if trimmed is not lines[2]:
+                    description = trimmed
+                    for line in lines[3:]:
+                        if line.strip() and not line.startswith('URL: '):
+                            description += " " + line.strip()
             
             if title and url:
                 results.append({
@@ -626,23 +727,230 @@ class WebHandler(BasePlatformHandler):
         
         return results
     
-    def _extract_domain_from_url(self, url: str) -> str:
-        """Extract domain from URL"""
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _extract_domain_from_url(url: str) -> str:
+        """Extract domain from URL (cached; result sets share few hosts)"""
         try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            return parsed.netloc
-        except:
+            return urlparse(url).netloc
+        except ValueError:
             return ""
 
 
+# Claude's translation calls run at temperature 0.1 and are effectively
+# deterministic, so results are memoized in-process and persisted to disk.
+# The cache is shared by every handler that translates keywords; entries are
+# keyed by namespace:SHA-1(keyword) so translations, fallback queries and
+# broader-keyword suggestions don't collide.
+_translation_mem: Dict[str, str] = {}
+_translation_disk: Optional[Dict[str, Any]] = None
+_TRANSLATION_CACHE_FILE = os.path.join("keywords", "translations.json")
+
+
+def _translation_key(keyword: str, namespace: str = "translate") -> str:
+    return f"{namespace}:{hashlib.sha1(keyword.encode()).hexdigest()}"
+
+
+def _load_translation_disk() -> Dict[str, Any]:
+    global _translation_disk
+    if _translation_disk is None:
+        try:
+            with open(_TRANSLATION_CACHE_FILE, 'rb') as f:
+                data = f.read()
+            _translation_disk = orjson.loads(data) if data else {}
+        except (FileNotFoundError, orjson.JSONDecodeError):
+            _translation_disk = {}
+    return _translation_disk
+
+
+def _save_translation_disk():
+    try:
+        os.makedirs(os.path.dirname(_TRANSLATION_CACHE_FILE), exist_ok=True)
+        with open(_TRANSLATION_CACHE_FILE, 'wb') as f:
+            f.write(orjson.dumps(_translation_disk, option=orjson.OPT_INDENT_2))
+    except OSError as e:
+        logger.warning("⚠️ Could not persist translation cache: %s", e)
+
+
+def _store_translation(keyword: str, value: Any, namespace: str = "translate"):
+    """Persist a translation so repeated runs skip the API round trip"""
+    _load_translation_disk()[_translation_key(keyword, namespace)] = value
+    _save_translation_disk()
+
+
+def _cached_translation(keyword: str, namespace: str = "translate") -> Optional[Any]:
+    if namespace == "translate":
+        cached = _translation_mem.get(keyword)
+        if cached is not None:
+            return cached
+    cached = _load_translation_disk().get(_translation_key(keyword, namespace))
+    if cached is not None and namespace == "translate":
+        _translation_mem[keyword] = cached
+    return cached
+
+
+def _normalize_mcp_response(response: Any) -> Any:
+    """Unwrap an MCP tool response into plain Python data.
+
+    Already-parsed dicts and lists pass straight through; TextContent
+    wrappers and JSON strings are decoded once here, and payloads that are
+    not JSON come back as the raw string so callers can run their
+    platform-specific text parsers. Centralizing the probing keeps the
+    per-handler extractors down to a couple of isinstance branches.
+    """
+    if isinstance(response, dict):
+        return response
+    if isinstance(response, str):
+        text = response
+    elif isinstance(response, list):
+        if not response or not hasattr(response[0], 'text'):
+            return response
+        text = response[0].text
+    else:
+        content = getattr(response, 'content', None)
+        if content is not None and content is not response:
+            return _normalize_mcp_response(content)
+        return {}
+    if text.lstrip()[:1] in ('[', '{'):
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    return text
+
+
+# Common Japanese to English translations for AI research, used when no
+# Claude client is available. The alternation pattern (longest keys first so
+# e.g. 大規模言語モデル wins over 言語モデル-style prefixes) finds any known
+# term inside a keyword with one scan instead of a per-entry substring loop.
+_FALLBACK_TRANSLATIONS = {
+    "生成AI": "generative AI",
+    "人工知能": "artificial intelligence",
+    "機械学習": "machine learning",
+    "深層学習": "deep learning",
+    "自然言語処理": "natural language processing",
+    "コンピュータビジョン": "computer vision",
+    "強化学習": "reinforcement learning",
+    "ニューラルネットワーク": "neural networks",
+    "大規模言語モデル": "large language models",
+    "LLM": "large language models",
+    "GPT": "GPT",
+    "ChatGPT": "ChatGPT",
+    "画像生成": "image generation",
+    "音声認識": "speech recognition",
+    "音声合成": "speech synthesis",
+    "推薦システム": "recommendation systems",
+    "異常検知": "anomaly detection",
+    "時系列予測": "time series prediction",
+    "クラスタリング": "clustering",
+    "分類": "classification"
+}
+_FALLBACK_JP_RE = re.compile(
+    '|'.join(map(re.escape, sorted(_FALLBACK_TRANSLATIONS, key=len, reverse=True)))
+)
+
+
+# Static instruction blocks for the Claude calls, hoisted so every request
+# sends a byte-identical prefix. cache_control lets the API reuse the
+# processed instructions across calls instead of re-reading them each time;
+# only the short keyword message varies per request.
+_TRANSLATE_SYSTEM = [{
+    "type": "text",
+    "text": """あなたはAI研究分野の専門家です。与えられた日本語のキーワードを、arXivで検索するのに適した英語のキーワードに翻訳してください。
+
+以下の点に注意してください：
+1. AI研究分野で一般的に使用される英語の専門用語を使用
+2. arXivで検索する際に効果的なキーワードを選択
+3. 複数の関連キーワードがある場合は、最も適切なものを1つ選択
+4. 回答は英語のキーワードのみで、説明は不要""",
+    "cache_control": {"type": "ephemeral"},
+}]
+
+_TRANSLATE_BATCH_SYSTEM = [{
+    "type": "text",
+    "text": """あなたはAI研究分野の専門家です。与えられた日本語のキーワードを、arXivで検索するのに適した英語のキーワードに翻訳してください。
+
+以下の点に注意してください：
+1. AI研究分野で一般的に使用される英語の専門用語を使用
+2. arXivで検索する際に効果的なキーワードを選択
+3. 各キーワードにつき最も適切な英語キーワードを1つ選択
+4. 回答は入力と同じ順番のJSON配列のみで、説明は不要（例: ["keyword1", "keyword2"]）""",
+    "cache_control": {"type": "ephemeral"},
+}]
+
+_FALLBACK_QUERY_SYSTEM = [{
+    "type": "text",
+    "text": """あなたはAI研究分野の専門家です。与えられた英語のキーワードでarXiv検索を行ったが結果が見つからなかった場合、より一般的で広範囲な検索キーワードを提案してください。
+
+以下の点に注意してください：
+1. より一般的で広範囲なAI関連のキーワードを提案
+2. 元のキーワードより具体的でない、より包括的なキーワードを選択
+3. arXivで検索する際に効果的なキーワードを選択
+4. 回答は英語のキーワードのみで、説明は不要""",
+    "cache_control": {"type": "ephemeral"},
+}]
+
+_BROADER_KEYWORDS_SYSTEM = [{
+    "type": "text",
+    "text": """あなたはAI研究分野の専門家です。与えられた英語のキーワードでHackerNews検索を行ったが結果が見つからなかった場合、より一般的で広範囲な検索キーワードを3つ提案してください。
+
+以下の点に注意してください：
+1. より一般的で広範囲なAI関連のキーワードを提案
+2. 元のキーワードより具体的でない、より包括的なキーワードを選択
+3. HackerNewsで検索する際に効果的なキーワードを選択
+4. 回答は英語のキーワードのみで、カンマ区切りで3つ提案""",
+    "cache_control": {"type": "ephemeral"},
+}]
+
+
 class ArxivHandler(BasePlatformHandler):
     """arXiv platform research handler"""
-    
+
     def __init__(self, claude_client=None):
         super().__init__("arxiv")
         self.claude_client = claude_client
-        print(f"🔍 ArxivHandler initialized with Claude client: {claude_client is not None}")
+        logger.debug("🔍 ArxivHandler initialized with Claude client: %s", claude_client is not None)
+
+    def translate_keywords_batch(self, keywords: List[str]) -> Dict[str, str]:
+        """Translate keywords with a single Claude request and cache the results
+
+        One batched round trip replaces the per-keyword calls that
+        _translate_keyword_with_claude would otherwise make during research.
+        """
+        pending = [kw for kw in keywords if _cached_translation(kw) is None]
+
+        if pending and self.claude_client:
+            try:
+                numbered = "\n".join(f"{i}. {kw}" for i, kw in enumerate(pending, 1))
+
+                response = self.claude_client.messages.create(
+                    model="claude-3-5-sonnet-20241022",
+                    max_tokens=50 * len(pending) + 50,
+                    temperature=0.1,
+                    system=_TRANSLATE_BATCH_SYSTEM,
+                    messages=[{"role": "user", "content": f"日本語キーワード:\n{numbered}\n\nJSON配列:"}]
+                )
+
+                text = response.content[0].text
+                json_match = re.search(r'\[.*\]', text, re.DOTALL)
+                translations = orjson.loads(json_match.group()) if json_match else []
+                if len(translations) == len(pending):
+                    disk_cache = _load_translation_disk()
+                    for keyword, english in zip(pending, translations):
+                        if isinstance(english, str) and english.strip():
+                            english = english.strip()
+                            _translation_mem[keyword] = english
+                            disk_cache[_translation_key(keyword)] = english
+                    _save_translation_disk()
+                    metrics.inc("claude.translate.batch_api")
+                    logger.debug("🤖 Claude batch-translated %s keywords", len(pending))
+                else:
+                    logger.warning("❌ Claude batch translation returned %s entries for %s keywords, ignoring", len(translations), len(pending))
+
+            except Exception as e:
+                logger.warning("❌ Claude batch translation error: %s", e)
+
+        return {kw: _translation_mem.get(kw, kw) for kw in keywords}
     
     async def research_keyword(self, client, keyword: str, config: Dict) -> Dict[str, Any]:
         """Research keyword on arXiv"""
@@ -657,123 +965,134 @@ class ArxivHandler(BasePlatformHandler):
             }
             
             tool_name = "search_arxiv"  # Fixed: use correct tool name from config
-            print(f"🔍 Calling arXiv tool '{tool_name}' with params: {params}")
-            print(f"🔍 Original keyword: '{keyword}' -> English query: '{english_query}'")
+            logger.debug("🔍 Calling arXiv tool '%s' with params: %s", tool_name, params)
+            logger.debug("🔍 Original keyword: '%s' -> English query: '%s'", keyword, english_query)
+
+            # Short queries miss often enough that the fallback search is
+            # kicked off speculatively alongside the primary; when the
+            # primary succeeds the speculation is cancelled, when it misses
+            # the fallback latency has already been overlapped.
+            fallback_task = None
+            if len(english_query.split()) < 3:
+                fallback_query = self._get_fallback_query_with_claude(english_query)
+                if fallback_query != english_query:
+                    logger.debug("🔍 Speculatively searching fallback query: '%s'", fallback_query)
+                    fallback_task = asyncio.create_task(
+                        client.call_tool(tool_name, {"query": fallback_query, "max_results": 10})
+                    )
+
             response = await client.call_tool(tool_name, params)
-            print(f"📄 arXiv raw response type: {type(response)}")
-            print(f"📄 arXiv raw response: {response}")
-            
+            logger.debug("📄 arXiv raw response type: %s", type(response))
+            logger.debug("📄 arXiv raw response: %s", response)
+
             # Check if we got results
             papers = self._extract_papers(response)
-            if not papers:
+            if papers:
+                if fallback_task is not None:
+                    fallback_task.cancel()
+            else:
                 # Try fallback search with broader terms
-                fallback_query = self._get_fallback_query_with_claude(english_query)
-                if fallback_query != english_query:
-                    print(f"🔍 No results found, trying fallback query: '{fallback_query}'")
-                    fallback_params = {
-                        "query": fallback_query,
-                        "max_results": 10
-                    }
-                    fallback_response = await client.call_tool(tool_name, fallback_params)
-                    print(f"📄 Fallback response: {fallback_response}")
-                    
+                if fallback_task is None:
+                    fallback_query = self._get_fallback_query_with_claude(english_query)
+                    if fallback_query != english_query:
+                        logger.debug("🔍 No results found, trying fallback query: '%s'", fallback_query)
+                        fallback_task = asyncio.create_task(
+                            client.call_tool(tool_name, {"query": fallback_query, "max_results": 10})
+                        )
+
+                if fallback_task is not None:
+                    fallback_response = await fallback_task
+                    logger.debug("📄 Fallback response: %s", fallback_response)
+
                     # Use fallback response if it has results
                     fallback_papers = self._extract_papers(fallback_response)
                     if fallback_papers:
                         response = fallback_response
-                        print(f"📄 Using fallback results: {len(fallback_papers)} papers found")
-            
+                        logger.debug("📄 Using fallback results: %s papers found", len(fallback_papers))
+
             return self.process_response(response, keyword)
             
         except Exception as e:
-            print(f"❌ Error in arXiv research: {e}")
+            logger.warning("❌ Error in arXiv research: %s", e)
             return self.create_error_result(keyword, str(e))
     
     def _translate_keyword_with_claude(self, keyword: str) -> str:
         """Translate Japanese keyword to English using Claude AI"""
-        print(f"🔍 Claude client available: {self.claude_client is not None}")
+        cached = _cached_translation(keyword)
+        if cached is not None:
+            metrics.inc("claude.translate.cache")
+            return cached
+
+        logger.debug("🔍 Claude client available: %s", self.claude_client is not None)
         if not self.claude_client:
-            print("⚠️ Claude client not available, using fallback translation")
+            logger.warning("⚠️ Claude client not available, using fallback translation")
             return self._translate_keyword_to_english_fallback(keyword)
-        
-        try:
-            prompt = f"""
-あなたはAI研究分野の専門家です。以下の日本語のキーワードを、arXivで検索するのに適した英語のキーワードに翻訳してください。
-
-日本語キーワード: {keyword}
-
-以下の点に注意してください：
-1. AI研究分野で一般的に使用される英語の専門用語を使用
-2. arXivで検索する際に効果的なキーワードを選択
-3. 複数の関連キーワードがある場合は、最も適切なものを1つ選択
-4. 回答は英語のキーワードのみで、説明は不要
-
-英語キーワード:"""
 
+        try:
             response = self.claude_client.messages.create(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=50,
                 temperature=0.1,
-                messages=[{"role": "user", "content": prompt}]
+                system=_TRANSLATE_SYSTEM,
+                messages=[{"role": "user", "content": f"日本語キーワード: {keyword}\n\n英語キーワード:"}]
             )
-            
+
             english_keyword = response.content[0].text.strip()
-            print(f"🤖 Claude translated '{keyword}' -> '{english_keyword}'")
+            logger.debug("🤖 Claude translated '%s' -> '%s'", keyword, english_keyword)
+            metrics.inc("claude.translate.api")
+            _translation_mem[keyword] = english_keyword
+            _store_translation(keyword, english_keyword)
             return english_keyword
-            
+
         except Exception as e:
-            print(f"❌ Claude translation error: {e}, using fallback")
+            logger.warning("❌ Claude translation error: %s, using fallback", e)
             return keyword
     
     def _get_fallback_query_with_claude(self, query: str) -> str:
         """Get a broader fallback query using Claude AI"""
+        cached = _cached_translation(query, namespace="fallback")
+        if cached is not None:
+            return cached
+
         if not self.claude_client:
             return self._get_fallback_query_fallback(query)
-        
-        try:
-            prompt = f"""
-あなたはAI研究分野の専門家です。以下の英語のキーワードでarXiv検索を行ったが結果が見つからなかった場合、より一般的で広範囲な検索キーワードを提案してください。
-
-元のキーワード: {query}
-
-以下の点に注意してください：
-1. より一般的で広範囲なAI関連のキーワードを提案
-2. 元のキーワードより具体的でない、より包括的なキーワードを選択
-3. arXivで検索する際に効果的なキーワードを選択
-4. 回答は英語のキーワードのみで、説明は不要
-
-提案するキーワード:"""
 
+        try:
             response = self.claude_client.messages.create(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=50,
                 temperature=0.1,
-                messages=[{"role": "user", "content": prompt}]
+                system=_FALLBACK_QUERY_SYSTEM,
+                messages=[{"role": "user", "content": f"元のキーワード: {query}\n\n提案するキーワード:"}]
             )
             
             fallback_keyword = response.content[0].text.strip()
-            print(f"🤖 Claude suggested fallback: '{query}' -> '{fallback_keyword}'")
+            logger.debug("🤖 Claude suggested fallback: '%s' -> '%s'", query, fallback_keyword)
+            _store_translation(query, fallback_keyword, namespace="fallback")
             return fallback_keyword
             
         except Exception as e:
-            print(f"❌ Claude fallback suggestion error: {e}, using fallback")
+            logger.warning("❌ Claude fallback suggestion error: %s, using fallback", e)
             return query
     
     def process_response(self, response: Any, keyword: str) -> Dict[str, Any]:
         """Process arXiv response"""
         results = []
         papers = self._extract_papers(response)
-        
+
+        # One clock read shared by every paper's age math in this batch
+        now_ts = datetime.now().timestamp()
+
         for paper in papers:
             if isinstance(paper, dict):
                 # Extract authors
                 authors = paper.get('authors', [])
                 if isinstance(authors, str):
-                    authors = [author.strip() for author in authors.split(',')]
+                    authors = _parse_list_field(authors)
                 
                 # Calculate metrics
                 published_date = paper.get('published', paper.get('published_date', ''))
-                days_old, is_recent = self._calculate_time_metrics(published_date)
+                days_old, is_recent = self._calculate_time_metrics(published_date, now_ts)
                 
                 results.append({
                     'title': paper.get('title', ''),
@@ -790,70 +1109,62 @@ class ArxivHandler(BasePlatformHandler):
                     'download_count': paper.get('download_count', 0),
                     'trend_score': self._calculate_trend_score(paper)
                 })
-        
-        return {
-            "platform": self.platform_name,
-            "keyword": keyword,
-            "timestamp": datetime.now().isoformat(),
-            "results": results,
-            "new_keywords": [],
-            "sentiment_score": 0.0,
-            "engagement_metrics": self._calculate_engagement_metrics(results)
-        }
+
+        return self.create_result(keyword, results, self._calculate_engagement_metrics(results))
     
     def _extract_papers(self, response: Any) -> List[Dict]:
         """Extract papers from various response formats"""
-        print(f"🔍 Extracting papers from response type: {type(response)}")
+        logger.debug("🔍 Extracting papers from response type: %s", type(response))
         papers = []
         
         # Handle None or empty response
         if not response:
-            print("📄 Response is empty or None")
+            logger.debug("📄 Response is empty or None")
             return papers
         
         # Handle string response (might be JSON string)
         if isinstance(response, str):
-            print(f"📄 Response is string: {response[:200]}...")
+            logger.debug("📄 Response is string: %s...", response[:200])
             # Check if it's Chinese format first
             if "找到" in response and "篇相关论文" in response:
-                print(f"📄 Detected Chinese format, parsing directly")
+                logger.debug("📄 Detected Chinese format, parsing directly")
                 return self._parse_chinese_arxiv_format(response)
             try:
-                parsed_data = json.loads(response)
+                parsed_data = orjson.loads(response)
                 return self._extract_papers(parsed_data)
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 # Try to parse as text format
                 return self._parse_arxiv_text_response(response)
         
         # Handle list response
         if isinstance(response, list):
-            print(f"📄 Response is list with {len(response)} items")
+            logger.debug("📄 Response is list with %s items", len(response))
             if len(response) > 0:
                 first_item = response[0]
-                print(f"📄 First item type: {type(first_item)}")
+                logger.debug("📄 First item type: %s", type(first_item))
                 
                 # Handle TextContent objects
                 if hasattr(first_item, 'text'):
                     text_content = first_item.text
-                    print(f"📄 First item has text attribute: {text_content[:200]}...")
+                    logger.debug("📄 First item has text attribute: %s...", text_content[:200])
                     
                     # Check if it's Chinese format first
                     if "找到" in text_content and "篇相关论文" in text_content:
-                        print(f"📄 Detected Chinese format in TextContent, parsing directly")
+                        logger.debug("📄 Detected Chinese format in TextContent, parsing directly")
                         return self._parse_chinese_arxiv_format(text_content)
                     
                     # Try JSON parsing only if it doesn't look like Chinese format
                     if text_content.strip().startswith('{') or text_content.strip().startswith('['):
                         try:
-                            parsed_data = json.loads(text_content)
-                            print(f"📄 Parsed JSON data type: {type(parsed_data)}")
+                            parsed_data = orjson.loads(text_content)
+                            logger.debug("📄 Parsed JSON data type: %s", type(parsed_data))
                             return self._extract_papers(parsed_data)
-                        except json.JSONDecodeError as e:
-                            print(f"❌ JSON parsing error: {e}")
+                        except orjson.JSONDecodeError as e:
+                            logger.warning("❌ JSON parsing error: %s", e)
                             return self._parse_arxiv_text_response(text_content)
                     else:
                         # Not JSON format, parse as text
-                        print(f"📄 Not JSON format, parsing as text")
+                        logger.debug("📄 Not JSON format, parsing as text")
                         return self._parse_arxiv_text_response(text_content)
                 else:
                     # Direct list of paper objects
@@ -861,49 +1172,38 @@ class ArxivHandler(BasePlatformHandler):
         
         # Handle dict response
         elif isinstance(response, dict):
-            print(f"📄 Response is dict with keys: {list(response.keys())}")
+            logger.debug("📄 Response is dict with keys: %s", list(response.keys()))
             # Try different possible keys for papers
             for key in ['papers', 'entries', 'data', 'results', 'items']:
                 if key in response:
                     papers = response[key]
-                    print(f"📄 Found papers under key '{key}': {len(papers)} items")
+                    logger.debug("📄 Found papers under key '%s': %s items", key, len(papers))
                     break
             
             # If no papers found, treat the whole response as a single paper
             if not papers and any(key in response for key in ['title', 'abstract', 'authors']):
                 papers = [response]
-                print("📄 Treating response as single paper")
+                logger.debug("📄 Treating response as single paper")
         
-        print(f"📄 Extracted {len(papers)} papers")
+        logger.debug("📄 Extracted %s papers", len(papers))
         return papers
     
     def _parse_arxiv_text_response(self, text: str) -> List[Dict]:
         """Parse arXiv paper results from text format"""
         results = []
-        
+
         # Check if response indicates no results found
-        no_results_indicators = [
-            "找到 0 篇相关论文",  # Chinese: Found 0 related papers
-            "0 篇相关论文",      # Chinese: 0 related papers
-            "no results found",  # English
-            "0 results",         # English
-            "no papers found",   # English
-            "0 papers"           # English
-        ]
-        
-        if any(indicator in text for indicator in no_results_indicators):
-            print(f"📄 No papers found in response: {text}")
+        if _NO_RESULTS_RE.search(text):
+            logger.debug("📄 No papers found in response: %s", text)
             return results
         
         # Parse Chinese format: "找到 X 篇相关论文（总计 Y 篇）："
         if "找到" in text and "篇相关论文" in text:
-            print(f"📄 Parsing Chinese format response")
+            logger.debug("📄 Parsing Chinese format response")
             return self._parse_chinese_arxiv_format(text)
         
         # Parse English format
-        sections = text.split('\n\n')
-        
-        for section in sections:
+        for section in _iter_sections(text):
             if not section.strip():
                 continue
                 
@@ -911,138 +1211,133 @@ class ArxivHandler(BasePlatformHandler):
             if len(lines) < 2:
                 continue
             
-            paper_info = {}
-            
+            # Start from the full default shape and fill fields in place,
+            # so the parsed dict is appended directly instead of being
+            # copied key-by-key into a second dict
+            paper_info = {
+                'title': '',
+                'abstract': '',
+                'authors': [],
+                'published_date': '',
+                'arxiv_id': '',
+                'url': '',
+                'categories': [],
+                'summary': '',
+                'citation_count': 0,
+                'download_count': 0
+            }
+
             for line in lines:
-                line = line.strip()
-                if line.startswith('Title: '):
-                    paper_info['title'] = line[7:]
-                elif line.startswith('Authors: '):
-                    authors_str = line[9:]
-                    paper_info['authors'] = [author.strip() for author in authors_str.split(',')]
-                elif line.startswith('Abstract: '):
-                    paper_info['abstract'] = line[10:]
-                elif line.startswith('Published: '):
-                    paper_info['published_date'] = line[11:]
-                elif line.startswith('arXiv ID: '):
-                    paper_info['arxiv_id'] = line[10:]
-                elif line.startswith('URL: '):
-                    paper_info['url'] = line[5:]
-                elif line.startswith('Categories: '):
-                    categories_str = line[12:]
-                    paper_info['categories'] = [cat.strip() for cat in categories_str.split(',')]
-            
-            if paper_info.get('title') and paper_info.get('arxiv_id'):
-                results.append({
-                    'title': paper_info.get('title', ''),
-                    'abstract': paper_info.get('abstract', ''),
-                    'authors': paper_info.get('authors', []),
-                    'published_date': paper_info.get('published_date', ''),
-                    'arxiv_id': paper_info.get('arxiv_id', ''),
-                    'url': paper_info.get('url', ''),
-                    'categories': paper_info.get('categories', []),
-                    'summary': paper_info.get('abstract', ''),
-                    'citation_count': 0,
-                    'download_count': 0
-                })
+                label, sep, value = line.strip().partition(': ')
+                if not sep:
+                    continue
+                field = _ARXIV_EN_FIELD_MAP.get(label)
+                if field:
+                    paper_info[field[0]] = field[1](value)
+
+            if paper_info['title'] and paper_info['arxiv_id']:
+                paper_info['summary'] = paper_info['abstract']
+                results.append(paper_info)
         
         return results
     
     def _parse_chinese_arxiv_format(self, text: str) -> List[Dict]:
-        """Parse Chinese format arXiv response"""
+        """Parse Chinese format arXiv response in a single offset-based pass
+
+        Section starts and line ends are located with search()/find()
+        offsets, so neither the full section list nor per-section line
+        lists are materialized for large responses.
+        """
         results = []
-        
-        print(f"📄 Starting Chinese format parsing for text length: {len(text)}")
-        
-        # Split by numbered entries (1. **Title**, 2. **Title**, etc.)
-        import re
-        paper_sections = re.split(r'\n\n\d+\.\s+\*\*', text)
-        
-        print(f"📄 Found {len(paper_sections)} sections after splitting")
-        
-        # If regex splitting didn't work well, try alternative approach
-        if len(paper_sections) <= 1:
-            print(f"📄 Regex splitting didn't work, trying alternative parsing")
+
+        logger.debug("📄 Starting Chinese format parsing for text length: %s", len(text))
+
+        # Numbered entries (1. **Title**, 2. **Title**, etc.); everything
+        # before the first match is the "找到 X 篇相关论文" header
+        match = _CN_SECTION_RE.search(text)
+        if match is None:
+            logger.debug("📄 Section pattern not found, trying alternative parsing")
             return self._parse_chinese_arxiv_alternative(text)
-        
-        # Skip the first section (header with "找到 X 篇相关论文")
-        for i, section in enumerate(paper_sections[1:], 1):
-            if not section.strip():
-                continue
-            
+
+        i = 1
+        while match is not None:
+            start = match.end()
+            match = _CN_SECTION_RE.search(text, start)
+            end = match.start() if match else len(text)
+
             try:
-                print(f"📄 Processing section {i}")
-                
-                # Extract title (everything before the first newline)
-                lines = section.strip().split('\n')
-                title = lines[0].strip()
-                
-                # Clean up title by removing trailing **
-                if title.endswith('**'):
-                    title = title[:-2]
-                
-                paper_info = {
-                    'title': title,
-                    'abstract': '',
-                    'authors': [],
-                    'published_date': '',
-                    'arxiv_id': '',
-                    'url': '',
-                    'categories': [],
-                    'summary': '',
-                    'citation_count': 0,
-                    'download_count': 0
-                }
-                
-                # Parse the rest of the lines
-                for line in lines[1:]:
-                    line = line.strip()
-                    if line.startswith('ID: '):
-                        paper_info['arxiv_id'] = line[4:]
-                    elif line.startswith('发布日期: '):
-                        paper_info['published_date'] = line[6:]
-                    elif line.startswith('作者: '):
-                        authors_str = line[4:]
-                        paper_info['authors'] = [author.strip() for author in authors_str.split(',')]
-                    elif line.startswith('摘要: '):
-                        paper_info['abstract'] = line[4:]
-                        paper_info['summary'] = line[4:]
-                    elif line.startswith('URL: '):
-                        paper_info['url'] = line[5:]
-                
+                logger.debug("📄 Processing section %s", i)
+                paper_info = self._parse_cn_section(text, start, end)
+
                 if paper_info['title'] and paper_info['arxiv_id']:
                     results.append(paper_info)
-                    print(f"📄 Successfully parsed paper: {paper_info['title'][:50]}...")
+                    logger.debug("📄 Successfully parsed paper: %s...", paper_info['title'][:50])
                 else:
-                    print(f"❌ Skipping paper due to missing title or arxiv_id")
-                
+                    logger.warning("❌ Skipping paper due to missing title or arxiv_id")
+
             except Exception as e:
-                print(f"❌ Error parsing paper section {i}: {e}")
-                continue
-        
-        print(f"📄 Successfully parsed {len(results)} papers from Chinese format")
+                logger.warning("❌ Error parsing paper section %s: %s", i, e)
+            i += 1
+
+        logger.debug("📄 Successfully parsed %s papers from Chinese format", len(results))
         return results
+
+    @staticmethod
+    def _parse_cn_section(text: str, start: int, end: int) -> Dict:
+        """Parse one numbered section of a Chinese arXiv response
+
+        The first line is the bolded title; the remaining labeled lines go
+        through the field map. Lines are sliced directly out of the parent
+        string via find() instead of building a split list.
+        """
+        line_end = text.find('\n', start, end)
+        if line_end < 0:
+            line_end = end
+        title = text[start:line_end].strip().removesuffix('**')
+
+        paper_info = {
+            'title': title,
+            'abstract': '',
+            'authors': [],
+            'published_date': '',
+            'arxiv_id': '',
+            'url': '',
+            'categories': [],
+            'summary': '',
+            'citation_count': 0,
+            'download_count': 0
+        }
+
+        pos = line_end + 1
+        while pos < end:
+            line_end = text.find('\n', pos, end)
+            if line_end < 0:
+                line_end = end
+            label, sep, value = text[pos:line_end].strip().partition(': ')
+            if sep:
+                field = _ARXIV_CN_FIELD_MAP.get(label)
+                if field:
+                    paper_info[field[0]] = field[1](value)
+            pos = line_end + 1
+        paper_info['summary'] = paper_info['abstract']
+        return paper_info
     
     def _parse_chinese_arxiv_alternative(self, text: str) -> List[Dict]:
         """Alternative parsing method for Chinese arXiv format"""
         results = []
         
         # Look for patterns like "**Title**" followed by metadata
-        import re
-        paper_pattern = r'\*\*(.*?)\*\*\s*\n\s*ID:\s*([^\n]+)\s*\n\s*发布日期:\s*([^\n]+)\s*\n\s*作者:\s*([^\n]+)\s*\n\s*摘要:\s*([^\n]+)\s*\n\s*URL:\s*([^\n]+)'
-        
-        matches = re.findall(paper_pattern, text, re.DOTALL)
+        matches = _CN_PAPER_RE.findall(text)
         
         for match in matches:
             try:
                 title, arxiv_id, published_date, authors_str, abstract, url = match
-                
+
                 # Clean up title
-                if title.endswith('**'):
-                    title = title[:-2]
+                title = title.removesuffix('**')
                 
                 # Parse authors
-                authors = [author.strip() for author in authors_str.split(',')]
+                authors = _parse_list_field(authors_str)
                 
                 paper_info = {
                     'title': title.strip(),
@@ -1059,109 +1354,78 @@ class ArxivHandler(BasePlatformHandler):
                 
                 if paper_info['title'] and paper_info['arxiv_id']:
                     results.append(paper_info)
-                    print(f"📄 Alternative parsing: {paper_info['title'][:50]}...")
+                    logger.debug("📄 Alternative parsing: %s...", paper_info['title'][:50])
                 
             except Exception as e:
-                print(f"❌ Error in alternative parsing: {e}")
+                logger.warning("❌ Error in alternative parsing: %s", e)
                 continue
         
-        print(f"📄 Alternative parsing found {len(results)} papers")
+        logger.debug("📄 Alternative parsing found %s papers", len(results))
         return results
     
-    def _calculate_time_metrics(self, published_date: str) -> tuple:
+    def _calculate_time_metrics(self, published_date: str, now_ts: Optional[float] = None) -> tuple:
         """Calculate time-based metrics for papers"""
         if not published_date:
             return (0, False)
-        
-        try:
-            # Handle various date formats including Chinese format with timezone
-            if 'T' in published_date and 'Z' in published_date:
-                # Format: "2025-02-16T23:19:44Z"
-                from datetime import datetime
-                pub_date = datetime.strptime(published_date, '%Y-%m-%dT%H:%M:%SZ')
-                days_old = (datetime.now() - pub_date).days
-                is_recent = days_old <= 365  # Papers published within a year
-                return (days_old, is_recent)
-            elif 'T' in published_date:
-                # Format: "2025-02-16T23:19:44"
-                published_date = published_date.split('T')[0]
-            
-            from datetime import datetime
-            pub_date = datetime.strptime(published_date, '%Y-%m-%d')
-            days_old = (datetime.now() - pub_date).days
-            is_recent = days_old <= 365  # Papers published within a year
-            
-            return (days_old, is_recent)
-        except Exception as e:
-            print(f"❌ Error parsing date '{published_date}': {e}")
+
+        # fromisoformat covers "2025-02-16", "2025-02-16T23:19:44" and (after
+        # the Z normalization inside the helper) "2025-02-16T23:19:44Z"
+        if now_ts is None:
+            now_ts = datetime.now().timestamp()
+        days_old = _days_old_from_iso(published_date, now_ts)
+        if days_old is None:
+            logger.warning("❌ Error parsing date '%s'", published_date)
             return (0, False)
+
+        is_recent = days_old <= 365  # Papers published within a year
+        return (days_old, is_recent)
     
     def _calculate_trend_score(self, paper: Dict) -> float:
         """Calculate trend score for a paper"""
-        score = 0.0
-        
-        # Recency bonus
-        days_old = paper.get('days_old', 0)
-        if days_old <= 30:
-            score += 30
-        elif days_old <= 90:
-            score += 20
-        elif days_old <= 365:
-            score += 10
-        
-        # Citation bonus
-        citations = paper.get('citation_count', 0)
-        if citations > 100:
-            score += 25
-        elif citations > 50:
-            score += 15
-        elif citations > 10:
-            score += 5
-        
+        # Recency and citation bonuses
+        score = (_PAPER_RECENCY_POINTS[bisect_left(_PAPER_RECENCY_THRESHOLDS, paper.get('days_old', 0))]
+                 + _CITATION_POINTS[bisect_left(_CITATION_THRESHOLDS, paper.get('citation_count', 0))])
+
         # Category relevance bonus
-        categories = paper.get('categories', [])
-        ai_categories = ['cs.AI', 'cs.LG', 'cs.CL', 'cs.CV', 'cs.NE', 'stat.ML']
-        if any(cat in categories for cat in ai_categories):
+        if not _AI_CATEGORIES.isdisjoint(paper.get('categories', ())):
             score += 15
-        
+
         return round(min(score, 100), 2)
     
     def _calculate_engagement_metrics(self, results: List[Dict]) -> Dict:
         """Calculate arXiv engagement metrics"""
         if not results:
             return {"paper_count": 0}
-        
+
+        # Single traversal: recency/citation totals and the category and
+        # author distributions all accumulate in one pass instead of five
         paper_count = len(results)
-        recent_papers = len([p for p in results if p.get('is_recent', False)])
-        total_citations = sum(p.get('citation_count', 0) for p in results)
-        
+        recent_papers = 0
+        total_citations = 0
+        cat_counts = Counter()
+        author_counts = Counter()
+        for paper in results:
+            if paper.get('is_recent', False):
+                recent_papers += 1
+            total_citations += paper.get('citation_count', 0)
+            cat_counts.update(paper.get('categories', ()))
+            author_counts.update(paper.get('authors', ()))
+
         metrics = {
             "paper_count": paper_count,
             "recent_papers": recent_papers,
-            "avg_citations": round(total_citations / paper_count, 2) if paper_count > 0 else 0,
+            "avg_citations": round(total_citations / paper_count, 2),
             "total_citations": total_citations
         }
-        
+
         # Category distribution
-        all_categories = []
-        for paper in results:
-            all_categories.extend(paper.get('categories', []))
-        
-        if all_categories:
-            from collections import Counter
-            cat_counts = Counter(all_categories)
+        if cat_counts:
             metrics["top_categories"] = dict(cat_counts.most_common(5))
-        
+
         # Author analysis
-        all_authors = []
-        for paper in results:
-            all_authors.extend(paper.get('authors', []))
-        
-        if all_authors:
-            from collections import Counter
-            author_counts = Counter(all_authors)
+        if author_counts:
             metrics["top_authors"] = dict(author_counts.most_common(3))
-        
+
         return metrics
 
 
@@ -1171,40 +1435,40 @@ class HackerNewsHandler(BasePlatformHandler):
     def __init__(self, claude_client=None):
         super().__init__("hackernews")
         self.claude_client = claude_client
-        print(f"🔍 HackerNewsHandler initialized with Claude client: {claude_client is not None}")
+        logger.debug("🔍 HackerNewsHandler initialized with Claude client: %s", claude_client is not None)
     
     async def research_keyword(self, client, keyword: str, config: Dict) -> Dict[str, Any]:
         """Research keyword on HackerNews"""
         try:
             # First try to get top stories as a fallback since search might not work well
-            print(f"🔍 Getting top stories from HackerNews for keyword: {keyword}")
+            logger.debug("🔍 Getting top stories from HackerNews for keyword: %s", keyword)
             
             # Try to get top stories first (this is more reliable)
             try:
                 top_stories_response = await client.call_tool("getStories", {"max_results": 15})
-                print(f"📄 Top stories response type: {type(top_stories_response)}")
+                logger.debug("📄 Top stories response type: %s", type(top_stories_response))
                 
                 # Debug: Print raw response for first few items
                 if isinstance(top_stories_response, list) and len(top_stories_response) > 0:
                     first_item = top_stories_response[0]
                     if hasattr(first_item, 'text'):
-                        print(f"📄 Raw response sample: {first_item.text[:500]}...")
+                        logger.debug("📄 Raw response sample: %s...", first_item.text[:500])
                 
                 top_posts = self._extract_posts(top_stories_response)
                 
                 if top_posts and len(top_posts) > 0:
-                    print(f"📄 Found {len(top_posts)} top stories")
+                    logger.debug("📄 Found %s top stories", len(top_posts))
                     return self.process_response(top_stories_response, keyword)
             except Exception as e:
-                print(f"❌ Error getting top stories: {e}")
+                logger.warning("❌ Error getting top stories: %s", e)
             
             # If top stories failed, try search with translated keyword
-            print(f"🔍 Trying search for keyword: {keyword}")
+            logger.debug("🔍 Trying search for keyword: %s", keyword)
             
             # Translate Japanese keyword to English using Claude API
             english_keyword = self._translate_keyword_with_claude(keyword)
             if english_keyword != keyword:
-                print(f"🔍 Claude translated keyword '{keyword}' -> '{english_keyword}'")
+                logger.debug("🔍 Claude translated keyword '%s' -> '%s'", keyword, english_keyword)
             
             params = {
                 "query": english_keyword,
@@ -1212,19 +1476,19 @@ class HackerNewsHandler(BasePlatformHandler):
             }
             
             tool_name = "search"
-            print(f"🔍 Calling HackerNews tool '{tool_name}' with params: {params}")
+            logger.debug("🔍 Calling HackerNews tool '%s' with params: %s", tool_name, params)
             response = await client.call_tool(tool_name, params)
-            print(f"📄 HackerNews search response type: {type(response)}")
+            logger.debug("📄 HackerNews search response type: %s", type(response))
             
             # Check if we got meaningful results
             posts = self._extract_posts(response)
             if not posts or self._has_undefined_values(posts):
-                print(f"🔍 No meaningful search results found for '{keyword}', trying broader search")
+                logger.debug("🔍 No meaningful search results found for '%s', trying broader search", keyword)
                 
                 # Try with broader English terms using Claude
                 broader_keywords = self._get_broader_keywords_with_claude(english_keyword)
                 for broader_keyword in broader_keywords:
-                    print(f"🔍 Trying broader keyword: '{broader_keyword}'")
+                    logger.debug("🔍 Trying broader keyword: '%s'", broader_keyword)
                     broader_params = {
                         "query": broader_keyword,
                         "max_results": 10
@@ -1235,81 +1499,76 @@ class HackerNewsHandler(BasePlatformHandler):
                         broader_posts = self._extract_posts(broader_response)
                         
                         if broader_posts and not self._has_undefined_values(broader_posts):
-                            print(f"📄 Found meaningful results with broader keyword '{broader_keyword}'")
+                            logger.debug("📄 Found meaningful results with broader keyword '%s'", broader_keyword)
                             return self.process_response(broader_response, keyword)
                     except Exception as e:
-                        print(f"❌ Error with broader keyword '{broader_keyword}': {e}")
+                        logger.warning("❌ Error with broader keyword '%s': %s", broader_keyword, e)
                         continue
                 
                 # If all searches failed, return top stories as fallback
-                print(f"🔍 All searches failed, returning top stories as fallback")
+                logger.debug("🔍 All searches failed, returning top stories as fallback")
                 try:
                     fallback_response = await client.call_tool("getStories", {"max_results": 15})
                     fallback_posts = self._extract_posts(fallback_response)
                     if fallback_posts and len(fallback_posts) > 0:
                         return self.process_response(fallback_response, keyword)
                 except Exception as e:
-                    print(f"❌ Error getting fallback top stories: {e}")
+                    logger.warning("❌ Error getting fallback top stories: %s", e)
                 
                 return self.create_error_result(keyword, "No meaningful results found")
             
             return self.process_response(response, keyword)
             
         except Exception as e:
-            print(f"❌ Error in HackerNews research: {e}")
+            logger.warning("❌ Error in HackerNews research: %s", e)
             return self.create_error_result(keyword, str(e))
     
     def _has_undefined_values(self, posts: List[Dict]) -> bool:
         """Check if posts have undefined values indicating poor search results"""
         if not posts:
             return True
-        
-        # Count how many posts have undefined/missing values
+
+        # A post is invalid when its title or score is missing/undefined.
+        # Results are poor once more than 50% are invalid, so the scan can
+        # stop the moment that threshold is reached instead of always
+        # touching every post.
+        threshold = len(posts) // 2 + 1
         invalid_count = 0
-        total_count = len(posts)
-        
         for post in posts:
-            if isinstance(post, dict):
-                # Check if key fields are undefined or missing
-                title = post.get('title', '')
-                if title == 'undefined' or not title:
-                    invalid_count += 1
-                    continue
-                
-                score = post.get('score', post.get('points', 0))
-                if score == 'undefined' or score is None:
-                    invalid_count += 1
-                    continue
-                
-                # If we have a valid title and score, this post is probably valid
-                if title and score != 'undefined' and score is not None:
-                    continue
-                
+            if not isinstance(post, dict):
+                continue
+            title = post.get('title', '')
+            score = post['score'] if 'score' in post else post.get('points', 0)
+            if not title or title == 'undefined' or score is None or score == 'undefined':
                 invalid_count += 1
-        
-        # If more than 50% of posts are invalid, consider the results poor
-        invalid_ratio = invalid_count / total_count if total_count > 0 else 1.0
-        print(f"📄 Invalid posts ratio: {invalid_count}/{total_count} ({invalid_ratio:.2%})")
-        
-        return invalid_ratio > 0.5
+                if invalid_count >= threshold:
+                    logger.debug("📄 Over half of %s posts invalid, stopping scan early", len(posts))
+                    return True
+
+        logger.debug("📄 Invalid posts ratio: %s/%s", invalid_count, len(posts))
+        return False
     
     def process_response(self, response: Any, keyword: str) -> Dict[str, Any]:
         """Process HackerNews response"""
         results = []
         posts = self._extract_posts(response)
-        
+
+        # One clock read shared by every post's age math in this batch
+        now_ts = datetime.now().timestamp()
+
         for post in posts:
             if isinstance(post, dict):
-                # Calculate metrics
-                score = post.get('score', post.get('points', 0))
-                comments_count = post.get('descendants', post.get('comments_count', 0))
-                created_time = post.get('time', post.get('created_at', ''))
-                days_old, is_recent = self._calculate_time_metrics(created_time)
-                
+                # Calculate metrics; check the primary key first so the
+                # fallback lookup only runs when it is actually needed
+                score = post['score'] if 'score' in post else post.get('points', 0)
+                comments_count = post['descendants'] if 'descendants' in post else post.get('comments_count', 0)
+                created_time = post['time'] if 'time' in post else post.get('created_at', '')
+                days_old, is_recent = self._calculate_time_metrics(created_time, now_ts)
+
                 results.append({
                     'title': post.get('title', ''),
-                    'url': post.get('url', post.get('link', '')),
-                    'author': post.get('by', post.get('author', '')),
+                    'url': post['url'] if 'url' in post else post.get('link', ''),
+                    'author': post['by'] if 'by' in post else post.get('author', ''),
                     'score': score,
                     'comments_count': comments_count,
                     'created_time': created_time,
@@ -1318,16 +1577,8 @@ class HackerNewsHandler(BasePlatformHandler):
                     'trend_score': self._calculate_trend_score(score, days_old, comments_count),
                     'type': post.get('type', 'story')
                 })
-        
-        return {
-            "platform": self.platform_name,
-            "keyword": keyword,
-            "timestamp": datetime.now().isoformat(),
-            "results": results,
-            "new_keywords": [],
-            "sentiment_score": 0.0,
-            "engagement_metrics": self._calculate_engagement_metrics(results)
-        }
+
+        return self.create_result(keyword, results, self._calculate_engagement_metrics(results))
     
     def _extract_posts(self, response: Any) -> List[Dict]:
         """Extract posts from various response formats"""
@@ -1338,28 +1589,32 @@ class HackerNewsHandler(BasePlatformHandler):
             first_item = response[0]
             if hasattr(first_item, 'text'):
                 text_content = first_item.text
-                print(f"📄 Parsing text content: {text_content[:200]}...")
+                logger.debug("📄 Parsing text content: %s...", text_content[:200])
                 
+                # One byte decides the format: JSON payloads start with
+                # '[' or '{', so try the orjson parse first for those and
+                # skip the substring probes entirely
+                if text_content.lstrip()[:1] in ('[', '{'):
+                    try:
+                        parsed_data = orjson.loads(text_content)
+                        if isinstance(parsed_data, list):
+                            return parsed_data
+                        if isinstance(parsed_data, dict):
+                            return parsed_data.get('posts', parsed_data.get('stories', parsed_data.get('data', [])))
+                    except orjson.JSONDecodeError as e:
+                        logger.warning("❌ JSON parsing error: %s", e)
+
                 # Check if it's a "No stories found" response
                 if "No stories found" in text_content:
-                    print(f"📄 No stories found in response")
+                    logger.debug("📄 No stories found in response")
                     return []
-                
+
                 # Try to parse the numbered list format we're seeing
                 if text_content.strip().startswith('1.') or 'ID:' in text_content:
-                    print(f"📄 Detected numbered format, parsing with regex")
+                    logger.debug("📄 Detected numbered format, parsing with regex")
                     return self._parse_hackernews_numbered_format(text_content)
-                
-                # Try JSON parsing
-                try:
-                    parsed_data = json.loads(text_content)
-                    if isinstance(parsed_data, list):
-                        posts = parsed_data
-                    elif isinstance(parsed_data, dict):
-                        posts = parsed_data.get('posts', parsed_data.get('stories', parsed_data.get('data', [])))
-                except (json.JSONDecodeError, AttributeError) as e:
-                    print(f"❌ JSON parsing error: {e}")
-                    posts = self._parse_hackernews_text_response(text_content)
+
+                posts = self._parse_hackernews_text_response(text_content)
             else:
                 # Direct list of post objects
                 posts = response
@@ -1373,12 +1628,11 @@ class HackerNewsHandler(BasePlatformHandler):
     def _parse_hackernews_numbered_format(self, text: str) -> List[Dict]:
         """Parse the numbered format response from HackerNews server"""
         results = []
-        
+
         # Split by numbered entries (1. title, 2. title, etc.)
-        import re
-        sections = re.split(r'\n\n\d+\.\s+', text)
+        sections = _NUMBERED_SECTION_RE.split(text)
         
-        print(f"📄 Found {len(sections)} sections in numbered format")
+        logger.debug("📄 Found %s sections in numbered format", len(sections))
         
         # Skip the first section if it's empty or just whitespace
         for i, section in enumerate(sections[1:], 1):
@@ -1408,14 +1662,13 @@ class HackerNewsHandler(BasePlatformHandler):
                     line = line.strip()
                     
                     # Handle ID line
-                    if line.startswith('ID: '):
-                        post_info['id'] = line[4:]
-                    
+                    if (value := line.removeprefix('ID: ')) is not line:
+                        post_info['id'] = value
+
                     # Handle URL line
-                    elif line.startswith('URL: '):
-                        url_part = line[5:]
-                        if url_part != '(text post)':
-                            post_info['url'] = url_part
+                    elif (value := line.removeprefix('URL: ')) is not line:
+                        if value != '(text post)':
+                            post_info['url'] = value
                     
                     # Handle Points | Author | Comments line (various formats)
                     elif 'Points:' in line:
@@ -1425,7 +1678,7 @@ class HackerNewsHandler(BasePlatformHandler):
                         # "Points: 906 | Author: iyaja"
                         
                         # Extract points
-                        points_match = re.search(r'Points:\s*(\d+)', line)
+                        points_match = _POINTS_RE.search(line)
                         if points_match:
                             try:
                                 post_info['score'] = int(points_match.group(1))
@@ -1433,14 +1686,14 @@ class HackerNewsHandler(BasePlatformHandler):
                                 post_info['score'] = 0
                         
                         # Extract author
-                        author_match = re.search(r'Author:\s*([^|]+)', line)
+                        author_match = _AUTHOR_RE.search(line)
                         if author_match:
                             author_part = author_match.group(1).strip()
                             if author_part != 'undefined':
                                 post_info['author'] = author_part
                         
                         # Extract comments
-                        comments_match = re.search(r'Comments?:\s*(\d+)', line)
+                        comments_match = _COMMENTS_RE.search(line)
                         if comments_match:
                             try:
                                 post_info['comments_count'] = int(comments_match.group(1))
@@ -1448,43 +1701,28 @@ class HackerNewsHandler(BasePlatformHandler):
                                 post_info['comments_count'] = 0
                     
                     # Handle separate metadata lines (fallback)
-                    elif line.startswith('Points: '):
-                        points_part = line[8:]
-                        if points_part != 'undefined':
-                            try:
-                                post_info['score'] = int(points_part)
-                            except ValueError:
-                                post_info['score'] = 0
-                    elif line.startswith('Author: '):
-                        author_part = line[8:]
-                        if author_part != 'undefined':
-                            post_info['author'] = author_part
-                    elif line.startswith('Comments: '):
-                        comments_part = line[10:]
-                        if comments_part != 'undefined':
-                            try:
-                                post_info['comments_count'] = int(comments_part)
-                            except ValueError:
-                                post_info['comments_count'] = 0
+                    else:
+                        label, sep, value = line.partition(': ')
+                        field = _HN_META_FIELD_MAP.get(label)
+                        if sep and field and value != 'undefined':
+                            post_info[field[0]] = field[1](value)
                 
                 # Only add if we have a meaningful title
                 if post_info['title'] and post_info['title'] != 'undefined':
                     results.append(post_info)
-                    print(f"📄 Parsed post: {post_info['title'][:50]}... (Score: {post_info['score']}, Author: {post_info['author']}, Comments: {post_info['comments_count']})")
+                    logger.debug("📄 Parsed post: %s... (Score: %s, Author: %s, Comments: %s)", post_info['title'][:50], post_info['score'], post_info['author'], post_info['comments_count'])
                 
             except Exception as e:
-                print(f"❌ Error parsing section {i}: {e}")
+                logger.warning("❌ Error parsing section %s: %s", i, e)
                 continue
         
-        print(f"📄 Successfully parsed {len(results)} posts from numbered format")
+        logger.debug("📄 Successfully parsed %s posts from numbered format", len(results))
         return results
     
     def _parse_hackernews_text_response(self, text: str) -> List[Dict]:
         """Parse HackerNews results from text format"""
         results = []
-        sections = text.split('\n\n')
-        
-        for section in sections:
+        for section in _iter_sections(text):
             if not section.strip():
                 continue
                 
@@ -1493,27 +1731,14 @@ class HackerNewsHandler(BasePlatformHandler):
                 continue
             
             post_info = {}
-            
+
             for line in lines:
-                line = line.strip()
-                if line.startswith('Title: '):
-                    post_info['title'] = line[7:]
-                elif line.startswith('URL: '):
-                    post_info['url'] = line[5:]
-                elif line.startswith('Author: '):
-                    post_info['author'] = line[8:]
-                elif line.startswith('Score: '):
-                    try:
-                        post_info['score'] = int(line[7:])
-                    except ValueError:
-                        post_info['score'] = 0
-                elif line.startswith('Comments: '):
-                    try:
-                        post_info['comments_count'] = int(line[10:])
-                    except ValueError:
-                        post_info['comments_count'] = 0
-                elif line.startswith('Created: '):
-                    post_info['created_time'] = line[9:]
+                label, sep, value = line.strip().partition(': ')
+                if not sep:
+                    continue
+                field = _HN_FIELD_MAP.get(label)
+                if field:
+                    post_info[field[0]] = field[1](value)
             
             if post_info.get('title'):
                 results.append({
@@ -1528,62 +1753,37 @@ class HackerNewsHandler(BasePlatformHandler):
         
         return results
     
-    def _calculate_time_metrics(self, created_time) -> tuple:
+    def _calculate_time_metrics(self, created_time, now_ts: Optional[float] = None) -> tuple:
         """Calculate time-based metrics for posts"""
         if not created_time:
             # If no created_time is provided, assume it's recent (within last week)
             # This is a reasonable assumption for top stories from HackerNews
             return (3, True)  # 3 days old, considered recent
-        
-        try:
-            # Handle Unix timestamp
-            if isinstance(created_time, (int, float)):
-                from datetime import datetime
-                created_date = datetime.fromtimestamp(created_time)
-                days_old = (datetime.now() - created_date).days
-                is_recent = days_old <= 7  # Posts from last week
-                return (days_old, is_recent)
-            
+
+        if now_ts is None:
+            now_ts = datetime.now().timestamp()
+
+        # Handle Unix timestamp
+        if isinstance(created_time, (int, float)):
+            days_old = int((now_ts - created_time) // _DAY_SECONDS)
+        else:
             # Handle string date
-            from datetime import datetime
-            created_date = datetime.fromisoformat(created_time.replace('Z', '+00:00'))
-            days_old = (datetime.now(created_date.tzinfo) - created_date).days
-            is_recent = days_old <= 7
-            
-            return (days_old, is_recent)
-        except Exception as e:
-            print(f"❌ Error parsing date '{created_time}': {e}")
+            days_old = _days_old_from_iso(created_time, now_ts)
+
+        if days_old is None:
+            logger.warning("❌ Error parsing date '%s'", created_time)
             # Return reasonable defaults if date parsing fails
             return (3, True)  # 3 days old, considered recent
+
+        is_recent = days_old <= 7  # Posts from last week
+        return (days_old, is_recent)
     
     def _calculate_trend_score(self, score: int, days_old: int, comments_count: int) -> float:
         """Calculate trend score for a post"""
-        trend_score = 0.0
-        
-        # Score bonus
-        if score > 100:
-            trend_score += 30
-        elif score > 50:
-            trend_score += 20
-        elif score > 20:
-            trend_score += 10
-        
-        # Recency bonus
-        if days_old <= 1:
-            trend_score += 25
-        elif days_old <= 3:
-            trend_score += 15
-        elif days_old <= 7:
-            trend_score += 5
-        
-        # Engagement bonus (comments)
-        if comments_count > 50:
-            trend_score += 20
-        elif comments_count > 20:
-            trend_score += 10
-        elif comments_count > 5:
-            trend_score += 5
-        
+        # Score, recency and engagement bonuses via the module-level ladders
+        trend_score = (_POST_SCORE_POINTS[bisect_left(_POST_SCORE_THRESHOLDS, score)]
+                       + _POST_RECENCY_POINTS[bisect_left(_POST_RECENCY_THRESHOLDS, days_old)]
+                       + _POST_COMMENTS_POINTS[bisect_left(_POST_COMMENTS_THRESHOLDS, comments_count)])
         return round(min(trend_score, 100), 2)
     
     def _calculate_engagement_metrics(self, results: List[Dict]) -> Dict:
@@ -1608,7 +1808,6 @@ class HackerNewsHandler(BasePlatformHandler):
         # Top authors
         authors = [post.get('author', '') for post in results if post.get('author')]
         if authors:
-            from collections import Counter
             author_counts = Counter(authors)
             metrics["top_authors"] = dict(author_counts.most_common(3))
         
@@ -1616,115 +1815,88 @@ class HackerNewsHandler(BasePlatformHandler):
 
     def _translate_keyword_with_claude(self, keyword: str) -> str:
         """Translate Japanese keyword to English using Claude API"""
-        print(f"🔍 Claude client available: {self.claude_client is not None}")
+        cached = _cached_translation(keyword)
+        if cached is not None:
+            metrics.inc("claude.translate.cache")
+            return cached
+
+        logger.debug("🔍 Claude client available: %s", self.claude_client is not None)
         if not self.claude_client:
-            print("⚠️ Claude client not available, using fallback translation")
+            logger.warning("⚠️ Claude client not available, using fallback translation")
             return self._translate_keyword_to_english_fallback(keyword)
         
         try:
-            prompt = f"""
-あなたはAI研究分野の専門家です。以下の日本語のキーワードを、arXivで検索するのに適した英語のキーワードに翻訳してください。
-
-日本語キーワード: {keyword}
-
-以下の点に注意してください：
-1. AI研究分野で一般的に使用される英語の専門用語を使用
-2. arXivで検索する際に効果的なキーワードを選択
-3. 複数の関連キーワードがある場合は、最も適切なものを1つ選択
-4. 回答は英語のキーワードのみで、説明は不要
-
-英語キーワード:"""
-
             response = self.claude_client.messages.create(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=50,
                 temperature=0.1,
-                messages=[{"role": "user", "content": prompt}]
+                system=_TRANSLATE_SYSTEM,
+                messages=[{"role": "user", "content": f"日本語キーワード: {keyword}\n\n英語キーワード:"}]
             )
             
             english_keyword = response.content[0].text.strip()
-            print(f"🤖 Claude translated '{keyword}' -> '{english_keyword}'")
+            logger.debug("🤖 Claude translated '%s' -> '%s'", keyword, english_keyword)
+            metrics.inc("claude.translate.api")
+            _translation_mem[keyword] = english_keyword
+            _store_translation(keyword, english_keyword)
             return english_keyword
-            
+
         except Exception as e:
-            print(f"❌ Claude translation error: {e}, using fallback")
+            logger.warning("❌ Claude translation error: %s, using fallback", e)
             return self._translate_keyword_to_english_fallback(keyword)
     
     def _translate_keyword_to_english_fallback(self, keyword: str) -> str:
         """Fallback translation method using hardcoded dictionary"""
-        # Common Japanese to English translations for AI research
-        translations = {
-            "生成AI": "generative AI",
-            "人工知能": "artificial intelligence",
-            "機械学習": "machine learning",
-            "深層学習": "deep learning",
-            "自然言語処理": "natural language processing",
-            "コンピュータビジョン": "computer vision",
-            "強化学習": "reinforcement learning",
-            "ニューラルネットワーク": "neural networks",
-            "大規模言語モデル": "large language models",
-            "LLM": "large language models",
-            "GPT": "GPT",
-            "ChatGPT": "ChatGPT",
-            "画像生成": "image generation",
-            "音声認識": "speech recognition",
-            "音声合成": "speech synthesis",
-            "推薦システム": "recommendation systems",
-            "異常検知": "anomaly detection",
-            "時系列予測": "time series prediction",
-            "クラスタリング": "clustering",
-            "分類": "classification"
-        }
-        
+        metrics.inc("claude.translate.fallback")
         # Direct translation
-        if keyword in translations:
-            return translations[keyword]
-        
-        # Try partial matches
-        for jp, en in translations.items():
-            if jp in keyword or keyword in jp:
+        english = _FALLBACK_TRANSLATIONS.get(keyword)
+        if english is not None:
+            return english
+
+        # Known term contained in the keyword: one alternation scan
+        match = _FALLBACK_JP_RE.search(keyword)
+        if match:
+            return _FALLBACK_TRANSLATIONS[match.group()]
+
+        # Keyword contained in a known term (abbreviated queries)
+        for jp, en in _FALLBACK_TRANSLATIONS.items():
+            if keyword in jp:
                 return en
-        
+
         # If no translation found, try to use the keyword as-is
         # Many Japanese researchers use English terms in their papers
         return keyword
     
     def _get_broader_keywords_with_claude(self, keyword: str) -> List[str]:
         """Get broader search terms for fallback searches using Claude API"""
+        cached = _cached_translation(keyword, namespace="broader")
+        if cached is not None:
+            return cached
+
         if not self.claude_client:
-            print("⚠️ Claude client not available, using fallback broader keywords")
+            logger.warning("⚠️ Claude client not available, using fallback broader keywords")
             return self._get_broader_keywords_fallback(keyword)
         
         try:
-            prompt = f"""
-あなたはAI研究分野の専門家です。以下の英語のキーワードでHackerNews検索を行ったが結果が見つからなかった場合、より一般的で広範囲な検索キーワードを3つ提案してください。
-
-元のキーワード: {keyword}
-
-以下の点に注意してください：
-1. より一般的で広範囲なAI関連のキーワードを提案
-2. 元のキーワードより具体的でない、より包括的なキーワードを選択
-3. HackerNewsで検索する際に効果的なキーワードを選択
-4. 回答は英語のキーワードのみで、カンマ区切りで3つ提案
-
-提案するキーワード:"""
-
             response = self.claude_client.messages.create(
                 model="claude-3-5-sonnet-20241022",
                 max_tokens=100,
                 temperature=0.1,
-                messages=[{"role": "user", "content": prompt}]
+                system=_BROADER_KEYWORDS_SYSTEM,
+                messages=[{"role": "user", "content": f"元のキーワード: {keyword}\n\n提案するキーワード:"}]
             )
             
             broader_keywords_text = response.content[0].text.strip()
             # Parse comma-separated keywords
             broader_keywords = [kw.strip() for kw in broader_keywords_text.split(',') if kw.strip()]
             
-            print(f"🤖 Claude suggested broader keywords: '{keyword}' -> {broader_keywords}")
-            return broader_keywords[:3]  # Limit to 3 keywords
+            logger.debug("🤖 Claude suggested broader keywords: '%s' -> %s", keyword, broader_keywords)
+            broader_keywords = broader_keywords[:3]  # Limit to 3 keywords
+            _store_translation(keyword, broader_keywords, namespace="broader")
+            return broader_keywords
             
         except Exception as e:
-            print(f"❌ Claude broader keywords error: {e}, using fallback")
+            logger.warning("❌ Claude broader keywords error: %s, using fallback", e)
             return keyword
 
 
@@ -1746,23 +1918,33 @@ class SupabaseHandler(BasePlatformHandler):
 class PlatformHandlerFactory:
     """Factory for creating platform handlers"""
     
+    _HANDLER_CLASSES = {
+        "youtube": YouTubeHandler,
+        "github": GitHubHandler,
+        "web": WebHandler,
+        "arxiv": ArxivHandler,
+        "hackernews": HackerNewsHandler,
+        "supabase": SupabaseHandler
+    }
+
+    # Handlers keep no per-keyword state, so one instance per platform (and
+    # Claude client, for the translating handlers) is reused across research
+    # calls instead of allocating a fresh handler every platform/keyword pair.
+    _instances: Dict[tuple, BasePlatformHandler] = {}
+
     @staticmethod
     def create_handler(platform: str, claude_client=None) -> BasePlatformHandler:
-        """Create appropriate handler for platform"""
-        handlers = {
-            "youtube": YouTubeHandler,
-            "github": GitHubHandler,
-            "web": WebHandler,
-            "arxiv": lambda: ArxivHandler(claude_client),
-            "hackernews": lambda: HackerNewsHandler(claude_client),
-            "supabase": SupabaseHandler
-        }
-        
-        handler_class = handlers.get(platform)
-        if handler_class:
-            if platform in ["arxiv", "hackernews"]:
-                return handler_class()
+        """Create (or reuse) the appropriate handler for platform"""
+        handler_class = PlatformHandlerFactory._HANDLER_CLASSES.get(platform)
+        if handler_class is None:
+            raise ValueError(f"No handler available for platform: {platform}")
+
+        key = (platform, id(claude_client))
+        handler = PlatformHandlerFactory._instances.get(key)
+        if handler is None:
+            if platform in ("arxiv", "hackernews"):
+                handler = handler_class(claude_client)
             else:
-                return handler_class()
-        else:
-            raise ValueError(f"No handler available for platform: {platform}")
\ No newline at end of file
+                handler = handler_class()
+            PlatformHandlerFactory._instances[key] = handler
+        return handler
\ No newline at end of file